@@ -0,0 +1,187 @@
+"""
+Benchmark reprodutível da IA.
+
+Roda analyze_position sobre posições fixas em várias profundidades e orçamentos de tempo,
+registrando tempo, nós, nós por segundo, pico de memória (tracemalloc) e a jogada escolhida.
+
+Uso:
+    python -m benchmarks.ai_benchmark run --output bench.json
+    python -m benchmarks.ai_benchmark compare baseline.json bench.json --threshold 0.15
+
+O modo compare sai com código 1 se alguma medição ficou mais lenta que o limite
+ou se a jogada escolhida mudou em relação à linha de base.
+"""
+import argparse
+import statistics
+import sys
+import tracemalloc
+
+from src.model.game_state import initialize_game, game_state_from_position
+from src.model.moves import move_from, move_to, move_captures
+from src.controller.ai_controller import analyze_position
+from benchmarks.reporting import report_metadata, write_report, add_compare_command, run_compare
+
+# Posições fixas: (nome, tabuleiro, jogador da vez).
+POSITIONS = [
+    ('abertura', [''.join(row) for row in initialize_game()['board']], 'BLACK'),
+    ('meio_jogo', [
+        '.b.b.b.b',
+        'b...b.b.',
+        '...b...b',
+        'b.......',
+        '.r...r..',
+        'r...r.r.',
+        '.r.r...r',
+        'r.r.r.r.',
+    ], 'BLACK'),
+    ('final_damas', [
+        '........',
+        '..B.....',
+        '........',
+        '....R...',
+        '........',
+        '..B.....',
+        '...r....',
+        '........',
+    ], 'BLACK'),
+    ('cadeia_captura', [
+        '.....b.b',
+        '..b.....',
+        '...r....',
+        '........',
+        '...r.r..',
+        'r.......',
+        '.r...r..',
+        '....r...',
+    ], 'BLACK'),
+    ('cadeia_dama', [
+        '.b......',
+        '........',
+        '...r.r..',
+        '........',
+        '.r...r..',
+        '..B.....',
+        '...r....',
+        'r.r.....',
+    ], 'BLACK'),
+]
+
+DEFAULT_DEPTHS = [2, 3, 4]
+DEFAULT_BUDGETS = [0.5]
+DEFAULT_THRESHOLD = 0.15
+
+
+def format_move(move):
+    if move is None:
+        return None
+    from_row, from_col = move_from(move)
+    to_row, to_col = move_to(move)
+    captures = ''.join(f"x{r}{c}" for r, c in move_captures(move))
+    return f"{from_row}{from_col}-{to_row}{to_col}{captures}"
+
+
+def measure(board, player, depth, time_limit, repeat, track_memory, options):
+    """Mede uma configuração; o tempo é a mediana de repeat execuções sem tracemalloc."""
+    times = []
+    result = None
+    for _ in range(repeat):
+        game_state = game_state_from_position(board, player)
+        result = analyze_position(game_state, depth=depth, time_limit=time_limit, **options)
+        times.append(result['time'])
+    elapsed = statistics.median(times)
+
+    peak_memory = None
+    if track_memory:
+        # Execução separada: o tracemalloc deixa a busca bem mais lenta e distorceria o tempo.
+        game_state = game_state_from_position(board, player)
+        tracemalloc.start()
+        analyze_position(game_state, depth=depth, time_limit=time_limit, **options)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        'time': elapsed,
+        'nodes': result['nodes'],
+        'reductions': result['reductions'],
+        're_searches': result['re_searches'],
+        'futility_pruned': result['futility_pruned'],
+        'solver_nodes': result['solver_nodes'],
+        'nps': result['nodes'] / elapsed if elapsed > 0 else 0.0,
+        'peak_memory': peak_memory,
+        'move': format_move(result['best_move']),
+        'score': result['score'],
+        'completed_depth': result['depth'],
+    }
+
+
+def run_benchmark(depths=DEFAULT_DEPTHS, budgets=DEFAULT_BUDGETS, repeat=3, track_memory=True,
+                  late_move_reductions=True, futility_pruning=True, proof_solver=True):
+    options = {'late_move_reductions': late_move_reductions, 'futility_pruning': futility_pruning,
+               'proof_solver': proof_solver}
+    results = []
+    for name, board, player in POSITIONS:
+        limits = [(depth, None) for depth in depths] + [(max(depths), budget) for budget in budgets]
+        for depth, time_limit in limits:
+            entry = {'position': name, 'depth': depth, 'time_limit': time_limit}
+            entry.update(measure(board, player, depth, time_limit, repeat, track_memory, options))
+            results.append(entry)
+            print(f"{name:16} depth={depth} budget={time_limit} "
+                  f"{entry['time'] * 1000:9.1f} ms {entry['nodes']:9} nós "
+                  f"{entry['nps']:10.0f} nós/s {entry['solver_nodes']:7} resolvedor  {entry['move']}",
+                  file=sys.stderr)
+    return dict(report_metadata(), options=options, results=results)
+
+
+def _entry_key(entry):
+    return (entry['position'], entry['depth'], entry['time_limit'])
+
+
+def compare_reports(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compara dois relatórios e devolve a lista de regressões encontradas.
+    Buscas por profundidade regridem pelo tempo; buscas por orçamento, pelos nós por segundo.
+    """
+    baseline_entries = {_entry_key(entry): entry for entry in baseline['results']}
+    regressions = []
+    for entry in current['results']:
+        base = baseline_entries.get(_entry_key(entry))
+        if base is None:
+            continue
+        label = f"{entry['position']} depth={entry['depth']} budget={entry['time_limit']}"
+        if entry['time_limit'] is None:
+            if base['time'] > 0 and entry['time'] > base['time'] * (1 + threshold):
+                regressions.append(f"{label}: tempo {base['time']:.4f}s -> {entry['time']:.4f}s")
+        elif base['nps'] > 0 and entry['nps'] < base['nps'] * (1 - threshold):
+            regressions.append(f"{label}: nós/s {base['nps']:.0f} -> {entry['nps']:.0f}")
+        if entry['move'] != base['move']:
+            regressions.append(f"{label}: jogada {base['move']} -> {entry['move']}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark da IA de damas")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="executa o benchmark")
+    run_parser.add_argument('--output', '-o', help="arquivo JSON de saída (padrão: stdout)")
+    run_parser.add_argument('--depths', type=int, nargs='+', default=DEFAULT_DEPTHS)
+    run_parser.add_argument('--budgets', type=float, nargs='*', default=DEFAULT_BUDGETS)
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--no-memory', action='store_true', help="não mede o pico de memória")
+    run_parser.add_argument('--no-lmr', action='store_true', help="desliga as reduções de lances tardios")
+    run_parser.add_argument('--no-futility', action='store_true', help="desliga a poda de futilidade")
+    run_parser.add_argument('--no-solver', action='store_true', help="desliga o resolvedor de provas")
+
+    add_compare_command(subparsers, DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        report = run_benchmark(args.depths, args.budgets, args.repeat, not args.no_memory,
+                               not args.no_lmr, not args.no_futility, not args.no_solver)
+        write_report(report, args.output)
+        return 0
+    return run_compare(args, compare_reports)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
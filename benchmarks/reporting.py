@@ -0,0 +1,51 @@
+"""
+Código comum aos benchmarks: metadados dos relatórios JSON, gravação e o comando compare.
+
+Cada benchmark fornece sua própria compare_reports(baseline, current, threshold), que devolve
+a lista de regressões; run_compare carrega os dois relatórios, imprime as regressões e
+devolve o código de saída (1 se houver alguma).
+"""
+import json
+import platform
+import time
+
+
+def report_metadata():
+    return {
+        'version': 1,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+    }
+
+
+def write_report(report, output=None):
+    """Grava o relatório no arquivo indicado, ou na saída padrão."""
+    text = json.dumps(report, indent=2)
+    if output:
+        with open(output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+
+def add_compare_command(subparsers, default_threshold):
+    compare_parser = subparsers.add_parser('compare', help="compara com uma linha de base")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=default_threshold)
+    return compare_parser
+
+
+def run_compare(args, compare_reports):
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    regressions = compare_reports(baseline, current, args.threshold)
+    for regression in regressions:
+        print(regression)
+    if regressions:
+        return 1
+    print("Sem regressões.")
+    return 0
@@ -0,0 +1,108 @@
+"""
+Benchmark de inicialização do cliente pygame.
+
+Cada medição roda em um processo Python novo (importações frias) com o vídeo do SDL em modo
+dummy, então funciona sem tela. São registrados, em milissegundos:
+- import: importar os módulos necessários para abrir o menu;
+- first_frame: do início do processo filho até o primeiro quadro do menu desenhado;
+- ai_import: importar a IA depois do menu, custo pago só no primeiro turno da IA.
+
+Uso:
+    python -m benchmarks.startup_benchmark run --output startup.json
+    python -m benchmarks.startup_benchmark compare baseline.json startup.json --threshold 0.2
+
+O modo compare sai com código 1 se alguma medição ficou mais lenta que o limite.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.reporting import report_metadata, write_report, add_compare_command, run_compare
+
+DEFAULT_REPEAT = 7
+DEFAULT_THRESHOLD = 0.2
+METRICS = ('import', 'first_frame', 'ai_import')
+
+
+def probe():
+    """Executado no processo filho: mede uma inicialização fria e imprime o resultado em JSON."""
+    start = time.perf_counter()
+    import pygame
+    from src.controller.menu_controller import handle_main_menu  # noqa: F401 (custo de importação do menu)
+    from src.view.menu_view import render_menu
+    from src.view.display import init_display
+    imported = time.perf_counter()
+
+    screen = init_display()
+    render_menu(screen)
+    first_frame = time.perf_counter()
+
+    from src.controller import ai_controller  # noqa: F401
+    ai_imported = time.perf_counter()
+    pygame.quit()
+
+    print(json.dumps({
+        'import': (imported - start) * 1000,
+        'first_frame': (first_frame - start) * 1000,
+        'ai_import': (ai_imported - first_frame) * 1000,
+    }))
+
+
+def measure_once():
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.startup_benchmark', 'probe'],
+        cwd=root, env=env, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_benchmark(repeat=DEFAULT_REPEAT):
+    samples = [measure_once() for _ in range(repeat)]
+    results = {metric: statistics.median(sample[metric] for sample in samples) for metric in METRICS}
+    for metric in METRICS:
+        print(f"{metric:12} {results[metric]:9.1f} ms", file=sys.stderr)
+    return dict(report_metadata(), repeat=repeat, results=results)
+
+
+def compare_reports(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """Compara dois relatórios e devolve a lista de medições que ficaram mais lentas que o limite."""
+    regressions = []
+    for metric in METRICS:
+        base = baseline['results'].get(metric)
+        value = current['results'].get(metric)
+        if base and value is not None and value > base * (1 + threshold):
+            regressions.append(f"{metric}: {base:.1f} ms -> {value:.1f} ms")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de inicialização do cliente de damas")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="executa o benchmark")
+    run_parser.add_argument('--output', '-o', help="arquivo JSON de saída (padrão: stdout)")
+    run_parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+
+    subparsers.add_parser('probe', help="uso interno: uma medição no processo atual")
+
+    add_compare_command(subparsers, DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+    if args.command == 'probe':
+        probe()
+        return 0
+    if args.command == 'run':
+        report = run_benchmark(args.repeat)
+        write_report(report, args.output)
+        return 0
+    return run_compare(args, compare_reports)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,12 +1,11 @@
 import asyncio
 import pygame
 from src.config.settings import *
+from src.view.display import init_display
 from src.controller.menu_controller import handle_main_menu
-from src.controller.game_controller import handle_game_loop
 
 async def main():
-    pygame.init()
-    screen = pygame.display.set_mode((BOARD_SIZE * SQUARE_SIZE, BOARD_SIZE * SQUARE_SIZE))
+    screen = init_display()
     
     running = True
     while running:
@@ -14,10 +13,10 @@ async def main():
     
         selection = await handle_main_menu(screen)
         
-        if selection == "1v1":
-            await handle_game_loop(screen, mode='pvp')
-        elif selection == "ai":
-            await handle_game_loop(screen, mode='ai')
+        if selection in ("1v1", "ai"):
+            # Importado sob demanda: o menu abre sem carregar o modelo do jogo.
+            from src.controller.game_controller import handle_game_loop
+            await handle_game_loop(screen, mode='pvp' if selection == "1v1" else 'ai')
         elif selection == "exit":
             running = False
             
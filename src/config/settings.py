@@ -1,6 +1,13 @@
 FPS = 60
 ANIMATION_SPEED = 5
 AI_DIFFICULTY = 3  
+AI_PONDER = True  # IA pondera durante o turno do humano (requer threads)
+AI_LATE_MOVE_REDUCTIONS = True  # Busca lances quietos tardios com profundidade reduzida
+AI_FUTILITY_PRUNING = True      # Ignora lances quietos sem chance de alcançar a janela na fronteira
+AI_PROOF_SOLVER = True          # Tenta provar vitórias forçadas (df-pn) em posições táticas; sem prova, vale a busca
+
+DRAW_REPETITIONS = 3    # Empate quando a mesma posição ocorre este número de vezes
+DRAW_QUIET_PLIES = 50   # Empate após este número de lances sem captura nem movimento de peça simples
 
 BOARD_SIZE = 8
 SQUARE_SIZE = 80
@@ -1,110 +1,505 @@
 from copy import deepcopy  
-from src.model.game_state import update_game_state  
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from src.model.game_state import update_game_state, position_key
 from src.model import moves  
+from src.model.evaluation import evaluate_board, TEMPO_BONUS
+from src.model.symmetry import canonical_key, mirror_move
+from src.controller.proof_solver import solve_position
+from src.config import settings
+
+
+class SearchAborted(Exception):
+    """Levantada quando uma busca em andamento é interrompida (ex.: fim da ponderação)."""
+
+
+DRAW_SCORE = 0
 
 
 def evaluate_state(game_state):
-    board = game_state['board']
-    red_val = 0
-    black_val = 0
-    for row in board:
-        for cell in row:
-            if cell.lower() == 'r':
-                if cell.isupper():
-                    red_val += 1.5
-                else:
-                    red_val += 1
-            elif cell.lower() == 'b':
-                if cell.isupper():
-                    black_val += 1.5
-                else:
-                    black_val += 1
-    return black_val - red_val 
+    if game_state.get('draw'):
+        return DRAW_SCORE
+    # O placar peça-casa é atualizado a cada jogada em update_game_state; aqui só somamos o tempo.
+    score = game_state.get('eval_score')
+    if score is None:
+        score = evaluate_board(game_state['board'])
+    if game_state['current_player'] == 'BLACK':
+        return score + TEMPO_BONUS
+    return score - TEMPO_BONUS
 
 
-def get_all_valid_moves(game_state, player):
-    moves_list = []
-    board = game_state['board']
-    board_size = len(board)
+def iter_all_valid_moves(game_state, player):
+    """Gera as jogadas (codificadas) do jogador sob demanda, com captura obrigatória."""
     # Se uma cadeia de captura estiver em andamento, use apenas os movimentos pré-armazenados.
     if game_state.get('selected_piece') is not None:
-        from_pos = game_state['selected_piece']
-        valid_moves = game_state.get('valid_moves', [])
-        for move in valid_moves:
-            moves_list.append((from_pos, move))
-        return moves_list
-    # Caso contrário, escaneie o tabuleiro.
-    for r in range(board_size):
-        for c in range(board_size):
-            piece = board[r][c]
-            if player == 'BLACK' and piece.lower() == 'b':
-                piece_moves = moves.get_valid_moves(board, r, c)
-                if piece_moves:
-                    for m in piece_moves:
-                        moves_list.append(((r, c), m))
-            elif player == 'RED' and piece.lower() == 'r':
-                piece_moves = moves.get_valid_moves(board, r, c)
-                if piece_moves:
-                    for m in piece_moves:
-                        moves_list.append(((r, c), m))
-    return moves_list
-
-
-def minimax(state, depth, maximizing):
+        yield from game_state.get('valid_moves', [])
+        return
+    yield from moves.generate_moves(game_state['board'], player)
+
+
+def get_all_valid_moves(game_state, player):
+    return list(iter_all_valid_moves(game_state, player))
+
+
+# Busca seletiva: reduções de lances tardios (LMR) e poda de futilidade.
+LMR_MIN_DEPTH = 3           # Profundidade mínima para reduzir lances tardios
+LMR_FULL_MOVES = 3          # Os primeiros lances de cada nó são sempre buscados por completo
+LMR_REDUCTION = 1           # Quanto um lance tardio tem a profundidade reduzida
+FUTILITY_MARGIN = 50        # Ganho máximo esperado de um lance quieto (centésimos de peça)
+
+# Tabela de transposição: indexada pela chave canônica, então uma posição e seu espelho
+# de cores compartilham a mesma entrada (com o placar de sinal trocado).
+TT_MAX_ENTRIES = 200000
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+_TT_FLIPPED_FLAG = {TT_EXACT: TT_EXACT, TT_LOWER: TT_UPPER, TT_UPPER: TT_LOWER}
+
+# Resolvedor de provas (src/controller/proof_solver.py), chamado antes da busca só em posições
+# agudas. O orçamento é próprio e fixo, e não depende da profundidade: o df-pn segue linhas
+# forçadas além do horizonte da busca. Sem vitória provada, a busca normal decide a jogada.
+SOLVER_MAX_PIECES = 6       # Poucas peças no tabuleiro
+SOLVER_MIN_CHAIN = 2        # Ou alguma cadeia de captura com pelo menos este número de peças
+SOLVER_MAX_NODES = 500      # Posições geradas por chamada (~80 ms no pior caso)
+SOLVER_TIME_SHARE = 0.25    # Fração de um prazo (time_limit) que o resolvedor pode usar
+SOLVER_TABLE_ENTRIES = 50000
+SOLVED_WIN_SCORE = 10000    # Placar de uma vitória provada, acima de qualquer avaliação material
+
+
+def new_search_context(stop=None, deadline=None, late_move_reductions=None, futility_pruning=None,
+                       proof_solver=None, tt=None):
+    """
+    Cria o contexto compartilhado por uma busca: sinal de parada opcional,
+    prazo (time.perf_counter()) opcional, chaves da busca seletiva e do resolvedor de provas
+    (padrão vindo de settings), a tabela de transposição (nova, ou uma já preenchida por
+    outra busca) e contadores de nós visitados, reduções, re-buscas, lances podados,
+    acertos na tabela e nós do resolvedor.
+    """
+    if late_move_reductions is None:
+        late_move_reductions = settings.AI_LATE_MOVE_REDUCTIONS
+    if futility_pruning is None:
+        futility_pruning = settings.AI_FUTILITY_PRUNING
+    if proof_solver is None:
+        proof_solver = settings.AI_PROOF_SOLVER
+    return {
+        'stop': stop,
+        'deadline': deadline,
+        'late_move_reductions': late_move_reductions,
+        'futility_pruning': futility_pruning,
+        'nodes': 0,
+        'reductions': 0,
+        're_searches': 0,
+        'futility_pruned': 0,
+        'tt': {} if tt is None else tt,
+        'tt_hits': 0,
+        'proof_solver': proof_solver,
+        'solver_nodes': 0,
+        'proof_line': None,
+    }
+
+
+def _enter_node(ctx):
+    if ctx is None:
+        return
+    ctx['nodes'] += 1
+    if ctx['stop'] is not None and ctx['stop'].is_set():
+        raise SearchAborted()
+    # Consulta o relógio só a cada 64 nós para não pesar na busca.
+    if ctx['deadline'] is not None and ctx['nodes'] % 64 == 0 and time.perf_counter() > ctx['deadline']:
+        raise SearchAborted()
+
+
+def _probe_tt(ctx, tt_key, sign, depth, alpha, beta):
+    """Devolve (placar, jogada) de uma entrada utilizável da tabela, ou None."""
+    entry = ctx['tt'].get(tt_key)
+    if entry is None or entry[0] < depth:
+        return None
+    _, flag, value, move = entry
+    if sign < 0:
+        # A entrada foi gravada a partir do espelho: desfaz a troca de cores.
+        flag = _TT_FLIPPED_FLAG[flag]
+        value = -value
+        move = mirror_move(move)
+    if flag == TT_EXACT or (flag == TT_LOWER and value >= beta) or (flag == TT_UPPER and value <= alpha):
+        ctx['tt_hits'] += 1
+        return value, move
+    return None
+
+
+def _store_tt(ctx, tt_key, sign, depth, value, move, alpha, beta):
+    tt = ctx['tt']
+    if len(tt) >= TT_MAX_ENTRIES and tt_key not in tt:
+        return
+    if value <= alpha:
+        flag = TT_UPPER
+    elif value >= beta:
+        flag = TT_LOWER
+    else:
+        flag = TT_EXACT
+    if sign < 0:
+        flag = _TT_FLIPPED_FLAG[flag]
+        value = -value
+        move = mirror_move(move)
+    tt[tt_key] = (depth, flag, value, move)
+
+
+def _tt_line(ctx, state, move, depth):
+    """
+    Variante principal de um acerto na tabela, que volta sem buscar: segue as jogadas gravadas
+    a partir de move, até depth lances. No meio de uma cadeia de captura (fora da tabela) só
+    continua se houver um único salto.
+    """
+    line = []
+    state = deepcopy(state)
+    while move is not None and len(line) < depth:
+        line.append(move)
+        update_game_state(state, move)
+        if state['game_over'] or state.get('repetitions', 0) > 1:
+            break
+        if state.get('selected_piece') is not None:
+            chain = state.get('valid_moves', [])
+            move = chain[0] if len(chain) == 1 else None
+            continue
+        tt_key, sign = canonical_key(state)
+        entry = ctx['tt'].get(tt_key)
+        move = None
+        if entry is not None:
+            move = mirror_move(entry[3]) if sign < 0 else entry[3]
+            if move not in moves.generate_moves(state['board'], state['current_player']):
+                move = None
+    return line
+
+
+def _is_tactical(state, move):
+    """Capturas e promoções nunca são reduzidas nem podadas."""
+    if moves.move_capture_count(move) > 0:
+        return True
+    from_row, from_col = moves.move_from(move)
+    piece = state['board'][from_row][from_col]
+    to_row = moves.move_to(move)[0]
+    return (piece == 'b' and to_row == len(state['board']) - 1) or (piece == 'r' and to_row == 0)
+
+
+def _search_child(new_state, depth, maximizing, ctx, child_pv, alpha, beta, reduce):
+    """
+    Busca a posição filha. Com reduce, busca primeiro com profundidade reduzida e só
+    repete com profundidade completa se o lance melhorar a janela de quem o jogou.
+    maximizing é o lado de quem jogou; o da filha vem do jogador da vez nela, que continua
+    o mesmo no meio de uma cadeia de captura.
+    """
+    if new_state.get('repetitions', 0) > 1:
+        # Posição já vista no histórico: empate, sem expandir o ciclo.
+        return DRAW_SCORE
+    child_maximizing = new_state['current_player'] == 'BLACK'
+    if reduce:
+        ctx['reductions'] += 1
+        eval_score, _ = minimax(new_state, depth - 1 - LMR_REDUCTION, child_maximizing, ctx, child_pv, alpha, beta)
+        improves = eval_score > alpha if maximizing else eval_score < beta
+        if not improves:
+            return eval_score
+        ctx['re_searches'] += 1
+        if child_pv is not None:
+            child_pv.clear()
+    eval_score, _ = minimax(new_state, depth - 1, child_maximizing, ctx, child_pv, alpha, beta)
+    return eval_score
+
+
+def minimax(state, depth, maximizing, ctx=None, pv=None, alpha=float('-inf'), beta=float('inf')):
+    """
+    Busca minimax com poda alfa-beta. As jogadas são geradas sob demanda, então um corte
+    evita gerar as jogadas restantes. Se pv for uma lista, ela recebe a variante principal
+    encontrada como uma sequência de jogadas.
+    maximizing deve corresponder ao jogador da vez (pretas maximizam); as jogadas geradas são
+    sempre as dele.
+    Com um contexto, aplica também as reduções de lances tardios e a poda de futilidade.
+    """
+    _enter_node(ctx)
     if depth == 0 or state['game_over']:
         return evaluate_state(state), None
 
+    selective = ctx is not None and state.get('selected_piece') is None
+    tt_key = None
+    # A chave inclui o jogador da vez: um lado trocado gravaria jogadas do outro jogador.
+    if selective and 'hash' in state and maximizing == (state['current_player'] == 'BLACK'):
+        tt_key, sign = canonical_key(state)
+        hit = _probe_tt(ctx, tt_key, sign, depth, alpha, beta)
+        if hit is not None:
+            if pv is not None:
+                pv[:] = _tt_line(ctx, state, hit[1], depth)
+            return hit
+        alpha_orig, beta_orig = alpha, beta
+    use_lmr = selective and ctx['late_move_reductions'] and depth >= LMR_MIN_DEPTH
+    # Na fronteira, lances quietos não alteram o placar além da margem: podem ser ignorados
+    # se nem com ela alcançam a janela.
+    static_eval = evaluate_state(state) if selective and ctx['futility_pruning'] and depth == 1 else None
+
     if maximizing:
         max_eval = float('-inf')
         best_move = None
   
-        possible_moves = get_all_valid_moves(state, 'BLACK')
-        if not possible_moves:
-            return evaluate_state(state), None
-        for from_pos, move in possible_moves:
+        for index, move in enumerate(iter_all_valid_moves(state, state['current_player'])):
+            tactical = selective and _is_tactical(state, move)
+            if static_eval is not None and not tactical and static_eval + FUTILITY_MARGIN <= alpha:
+                ctx['futility_pruned'] += 1
+                continue
             new_state = deepcopy(state)  
-            new_state['selected_piece'] = from_pos
             update_game_state(new_state, move)
-            eval_score, _ = minimax(new_state, depth - 1, False)
+            child_pv = [] if pv is not None else None
+            reduce = use_lmr and index >= LMR_FULL_MOVES and not tactical
+            eval_score = _search_child(new_state, depth, True, ctx, child_pv, alpha, beta, reduce)
             if eval_score > max_eval:
                 max_eval = eval_score
-                best_move = (from_pos, move)
+                best_move = move
+                if pv is not None:
+                    pv[:] = [best_move] + child_pv
+            alpha = max(alpha, eval_score)
+            if alpha >= beta:
+                break
+        if best_move is None:
+            return evaluate_state(state), None
+        if tt_key is not None:
+            _store_tt(ctx, tt_key, sign, depth, max_eval, best_move, alpha_orig, beta_orig)
         return max_eval, best_move
     else:
         min_eval = float('inf')
         best_move = None
    
-        possible_moves = get_all_valid_moves(state, 'RED')
-        if not possible_moves:
-            return evaluate_state(state), None
-        for from_pos, move in possible_moves:
+        for index, move in enumerate(iter_all_valid_moves(state, state['current_player'])):
+            tactical = selective and _is_tactical(state, move)
+            if static_eval is not None and not tactical and static_eval - FUTILITY_MARGIN >= beta:
+                ctx['futility_pruned'] += 1
+                continue
             new_state = deepcopy(state)
-            new_state['selected_piece'] = from_pos
             update_game_state(new_state, move)
-            eval_score, _ = minimax(new_state, depth - 1, True)
+            child_pv = [] if pv is not None else None
+            reduce = use_lmr and index >= LMR_FULL_MOVES and not tactical
+            eval_score = _search_child(new_state, depth, False, ctx, child_pv, alpha, beta, reduce)
             if eval_score < min_eval:
                 min_eval = eval_score
-                best_move = (from_pos, move)
+                best_move = move
+                if pv is not None:
+                    pv[:] = [best_move] + child_pv
+            beta = min(beta, eval_score)
+            if alpha >= beta:
+                break
+        if best_move is None:
+            return evaluate_state(state), None
+        if tt_key is not None:
+            _store_tt(ctx, tt_key, sign, depth, min_eval, best_move, alpha_orig, beta_orig)
         return min_eval, best_move
 
 
-def calculate_ai_move(game_state, depth=5):
-    score, best_move = minimax(game_state, depth, True)
+def is_sharp_position(game_state):
+    """
+    Posições táticas, onde vale tentar provar o resultado: poucas peças ou capturas longas.
+    Só vale no início do turno; os saltos seguintes de uma cadeia seguem a linha já provada.
+    """
+    if game_state.get('selected_piece') is not None:
+        return False
+    pieces = sum(1 for row in game_state['board'] for cell in row if cell != '.')
+    if pieces <= SOLVER_MAX_PIECES:
+        return True
+    return any(moves.move_capture_count(move) >= SOLVER_MIN_CHAIN
+               for move in iter_all_valid_moves(game_state, game_state['current_player']))
+
+
+def _pending_proof_line(game_state):
+    """No meio de uma cadeia que começou por uma vitória provada, devolve o resto da linha."""
+    line = game_state.get('proof_line')
+    if game_state.get('selected_piece') is not None and line and line[0] in game_state.get('valid_moves', []):
+        return line
+    return None
+
+
+def remember_proof_line(game_state, line, move):
+    """
+    Chamada depois de aplicar a jogada da IA: se o turno continua (cadeia de captura) dentro
+    de uma linha provada, guarda o resto dela para o próximo salto; senão, descarta.
+    """
+    if (line and line[0] == move and game_state.get('selected_piece') is not None
+            and not game_state.get('game_over')):
+        game_state['proof_line'] = line[1:]
+    else:
+        game_state.pop('proof_line', None)
+
+
+def _solve(game_state, ctx):
+    """Roda o resolvedor com o orçamento fixo e o prazo do contexto; devolve a linha provada ou None."""
+    solved = solve_position(game_state, SOLVER_MAX_NODES, SOLVER_TABLE_ENTRIES, ctx['stop'], ctx['deadline'])
+    ctx['solver_nodes'] += solved['nodes']
+    if solved['result'] == 'win' and solved['line']:
+        return solved['line']
+    # Derrota ou resultado desconhecido ficam com a busca normal, que escolhe a melhor resistência.
+    return None
+
+
+def calculate_ai_move(game_state, depth=5, ctx=None):
+    """
+    Escolhe a jogada das pretas. Em posições agudas o resolvedor roda antes da busca, que só
+    é feita se ele não provar uma vitória; a linha provada fica em ctx['proof_line'].
+    """
+    if ctx is None:
+        ctx = new_search_context()
+    ctx['proof_line'] = _pending_proof_line(game_state)
+    if ctx['proof_line'] is None and ctx['proof_solver'] and is_sharp_position(game_state):
+        ctx['proof_line'] = _solve(game_state, ctx)
+    if ctx['proof_line']:
+        return ctx['proof_line'][0]
+    score, best_move = minimax(game_state, depth, game_state['current_player'] == 'BLACK', ctx)
     return best_move
 
 
-def handle_ai_turn(game_state):
+def analyze_position(game_state, depth=5, time_limit=None, late_move_reductions=None, futility_pruning=None,
+                     proof_solver=None):
+    """
+    Analisa a posição para o jogador da vez e retorna um dicionário com a melhor jogada,
+    a avaliação (positiva favorece as pretas), a variante principal e estatísticas da busca.
+    Com time_limit (segundos), aprofunda iterativamente até depth e devolve o resultado
+    da última profundidade concluída dentro do prazo. As chaves da busca seletiva e do
+    resolvedor de provas sobrescrevem os valores de settings quando informadas.
+    Em posições agudas o resolvedor de provas roda antes da busca (com até SOLVER_TIME_SHARE
+    do prazo); uma vitória provada, ou o resto dela no meio de uma cadeia de captura, dispensa
+    a busca: a linha vem em pv e proof_line, com placar SOLVED_WIN_SCORE e depth 0.
+    """
+    start = time.perf_counter()
+    deadline = start + time_limit if time_limit is not None else None
+    ctx = new_search_context(deadline=deadline, late_move_reductions=late_move_reductions,
+                             futility_pruning=futility_pruning, proof_solver=proof_solver)
+    maximizing = game_state['current_player'] == 'BLACK'
+    result = {'best_move': None, 'score': None, 'pv': [], 'depth': 0}
+    proof_line = _pending_proof_line(game_state)
+    if proof_line is None and ctx['proof_solver'] and is_sharp_position(game_state):
+        if deadline is not None:
+            ctx['deadline'] = start + time_limit * SOLVER_TIME_SHARE
+        proof_line = _solve(game_state, ctx)
+        ctx['deadline'] = deadline
+    if proof_line:
+        score = SOLVED_WIN_SCORE if maximizing else -SOLVED_WIN_SCORE
+        result.update(best_move=proof_line[0], score=score, pv=list(proof_line))
+    else:
+        first_depth = 1 if time_limit is not None else depth
+        try:
+            for current_depth in range(first_depth, depth + 1):
+                pv = []
+                score, best_move = minimax(game_state, current_depth, maximizing, ctx, pv)
+                result.update(best_move=best_move, score=score, pv=pv, depth=current_depth)
+        except SearchAborted:
+            pass
+    result['proof_line'] = list(proof_line or [])
+    elapsed = time.perf_counter() - start
+    for counter in ('nodes', 'reductions', 're_searches', 'futility_pruned', 'tt_hits', 'solver_nodes'):
+        result[counter] = ctx[counter]
+    result['time'] = elapsed
+    result['nps'] = ctx['nodes'] / elapsed if elapsed > 0 else 0.0
+    return result
+
+
+# Executor de uma única thread usado para ponderar durante o turno do humano.
+_ponder_executor = None
+
+
+def _predicted_replies(game_state):
+    """
+    Lista as respostas das vermelhas que terminam o turno, das mais prováveis
+    para as menos prováveis (melhor avaliação para as vermelhas primeiro).
+    """
+    replies = []
+    for move in get_all_valid_moves(game_state, 'RED'):
+        new_state = deepcopy(game_state)
+        update_game_state(new_state, move)
+        if new_state['game_over'] or new_state['current_player'] != 'BLACK':
+            continue
+        replies.append((evaluate_state(new_state), new_state))
+    replies.sort(key=lambda reply: reply[0])
+    return [new_state for _, new_state in replies]
+
+
+def ponder_replies(ponder, game_state, depth):
+    """
+    Calcula antecipadamente a resposta da IA para cada jogada provável do humano.
+    Os resultados ficam em ponder['results'], indexados pela chave da posição.
+    Para quando ponder['stop'] é sinalizado ou quando a posição alvo já foi analisada.
+    """
+    ctx = new_search_context(stop=ponder['stop'], tt=ponder['tt'])
+    try:
+        for new_state in _predicted_replies(game_state):
+            if ponder['stop'].is_set() or ponder['target'] is not None:
+                break
+            key = position_key(new_state)
+            ponder['current'] = key
+            ponder['results'][key] = calculate_ai_move(new_state, depth, ctx)
+            ponder['proof_lines'][key] = ctx['proof_line']
+    except SearchAborted:
+        pass
+    ponder['current'] = None
+
+
+def start_pondering(game_state, depth):
+    """
+    Inicia a ponderação em segundo plano sobre uma cópia do estado.
+    Retorna None quando threads não estão disponíveis (ex.: build web).
+    """
+    global _ponder_executor
+    ponder = {
+        'stop': threading.Event(),
+        'target': None,
+        'current': None,
+        'results': {},
+        'proof_lines': {},
+        'tt': {},  # Tabela de transposição da ponderação, reaproveitada se a previsão falhar
+        'future': None,
+    }
+    try:
+        if _ponder_executor is None:
+            _ponder_executor = ThreadPoolExecutor(max_workers=1)
+        ponder['future'] = _ponder_executor.submit(ponder_replies, ponder, deepcopy(game_state), depth)
+    except RuntimeError:
+        return None
+    return ponder
+
+
+def stop_pondering(ponder):
+    if ponder is not None:
+        ponder['stop'].set()
+
+
+def take_pondered_move(ponder, game_state):
+    """
+    Encerra a ponderação e devolve (True, jogada) se a jogada do humano foi prevista.
+    Se a posição ainda estiver sendo analisada, aguarda essa busca terminar em vez de recomeçar.
+    """
+    key = position_key(game_state)
+    if ponder['current'] == key:
+        ponder['target'] = key
+    else:
+        ponder['stop'].set()
+    ponder['future'].result()
+    if key in ponder['results']:
+        return True, ponder['results'][key]
+    return False, None
+
+
+def handle_ai_turn(game_state, ponder=None):
     from src.config.settings_manager import get_ai_difficulty
     
 
     ai_difficulty = get_ai_difficulty()
     
-    best_move = calculate_ai_move(game_state, depth=ai_difficulty)
+    hit = False
+    ctx = None
+    proof_line = None
+    if ponder is not None:
+        hit, best_move = take_pondered_move(ponder, game_state)
+        proof_line = ponder['proof_lines'].get(position_key(game_state))
+        # Previsão errada: a busca parte da tabela de transposição preenchida na ponderação.
+        ctx = new_search_context(tt=ponder['tt'])
+    if not hit:
+        ctx = ctx or new_search_context()
+        best_move = calculate_ai_move(game_state, depth=ai_difficulty, ctx=ctx)
+        proof_line = ctx['proof_line']
     if best_move is not None:
-        from_pos, move = best_move
-
-        game_state['selected_piece'] = from_pos
-        game_state['valid_moves'] = [move] 
-        update_game_state(game_state, move)
+        game_state['selected_piece'] = moves.move_from(best_move)
+        game_state['valid_moves'] = [best_move] 
+        update_game_state(game_state, best_move)
+        remember_proof_line(game_state, proof_line, best_move)
     else:
         print("IA não tem movimentos válidos")
@@ -0,0 +1,290 @@
+"""
+Servidor local de análise: expõe o motor da IA para outras ferramentas sem pygame.
+
+Protocolo: linhas JSON sobre TCP (localhost) ou socket Unix. Cada requisição é um objeto:
+    {"id": 1, "board": ["........", ...], "player": "BLACK", "selected": null,
+     "depth": 4, "time_limit": 1.0, "deadline": 5.0}
+- board: 8 strings com '.', 'r', 'R', 'b', 'B' (linha 0 no topo).
+- player: jogador da vez ('RED' ou 'BLACK'); selected: peça em cadeia de captura, se houver.
+- depth / time_limit: limites da busca; deadline: segundos, a partir da chegada, para responder.
+A resposta traz o mesmo id com best_move, score, pv, depth, nodes, time e nps, ou um campo error.
+
+Uso:
+    python -m src.controller.analysis_server --port 8765
+    python -m src.controller.analysis_server --unix /tmp/damas.sock
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from src.model.game_state import game_state_from_position
+from src.model.symmetry import canonical_key, mirror_square
+from src.model.moves import move_from, move_to, move_captures
+from src.controller.ai_controller import analyze_position
+
+DEFAULT_DEPTH = 4
+MAX_DEPTH = 8
+CACHE_SIZE = 4096
+DEADLINE_SEARCH_FRACTION = 0.8
+
+
+def move_to_json(move):
+    if move is None:
+        return None
+    return {
+        'from': list(move_from(move)),
+        'to': list(move_to(move)),
+        'captures': [list(pos) for pos in move_captures(move)],
+    }
+
+
+def _mirror_json_move(move):
+    if move is None:
+        return None
+    return {
+        'from': list(mirror_square(move['from'])),
+        'to': list(mirror_square(move['to'])),
+        'captures': [list(mirror_square(pos)) for pos in move['captures']],
+    }
+
+
+def orient_result(result, sign):
+    """
+    Converte um resultado entre a orientação da requisição e a canônica (sinal de canonical_key).
+    Com sinal -1 o placar troca de sinal e as jogadas são espelhadas; a operação é sua própria inversa.
+    """
+    if sign > 0:
+        return result
+    oriented = dict(result)
+    oriented['score'] = -result['score'] if result['score'] is not None else None
+    oriented['best_move'] = _mirror_json_move(result['best_move'])
+    oriented['pv'] = [_mirror_json_move(move) for move in result['pv']]
+    return oriented
+
+
+def run_analysis(board, player, selected, depth, time_limit):
+    """Executado nos processos de trabalho: analisa uma posição e devolve um resultado serializável."""
+    game_state = game_state_from_position(board, player, selected)
+    result = analyze_position(game_state, depth=depth, time_limit=time_limit)
+    return {
+        'best_move': move_to_json(result['best_move']),
+        'score': result['score'],
+        'pv': [move_to_json(move) for move in result['pv']],
+        'depth': result['depth'],
+        'nodes': result['nodes'],
+        'solver_nodes': result['solver_nodes'],
+        'time': result['time'],
+        'nps': result['nps'],
+    }
+
+
+def _warm_up():
+    # Importa o motor e roda uma busca rasa para que o primeiro pedido real não pague esse custo.
+    from src.model.game_state import initialize_game
+    analyze_position(initialize_game(), depth=1)
+    return os.getpid()
+
+
+def parse_request(request):
+    """Valida uma requisição e devolve (game_state, depth, time_limit, deadline_seconds)."""
+    board = request.get('board')
+    if not isinstance(board, list) or len(board) != 8 or any(len(row) != 8 for row in board):
+        raise ValueError("board deve ter 8 linhas de 8 casas")
+    if any(cell not in '.rRbB' for row in board for cell in row):
+        raise ValueError("board contém peças inválidas")
+    player = request.get('player', 'BLACK')
+    if player not in ('RED', 'BLACK'):
+        raise ValueError("player deve ser 'RED' ou 'BLACK'")
+    selected = request.get('selected')
+    if selected is not None:
+        selected = tuple(selected)
+    depth = int(request.get('depth', DEFAULT_DEPTH))
+    if not 1 <= depth <= MAX_DEPTH:
+        raise ValueError(f"depth deve estar entre 1 e {MAX_DEPTH}")
+    time_limit = request.get('time_limit')
+    deadline = request.get('deadline')
+    for name, value in (('time_limit', time_limit), ('deadline', deadline)):
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0):
+            raise ValueError(f"{name} deve ser um número positivo de segundos")
+    game_state = game_state_from_position(board, player, selected)
+    return game_state, depth, time_limit, deadline
+
+
+def create_server_state(workers=None, cache_size=CACHE_SIZE):
+    workers = workers or os.cpu_count() or 1
+    return {
+        'executor': ProcessPoolExecutor(max_workers=workers),
+        'workers': workers,
+        'queue': asyncio.Queue(),
+        'in_flight': {},                # chave da análise -> (future compartilhado, prazo) (agrupamento)
+        'cache': OrderedDict(),         # chave da análise -> resultado (LRU)
+        'cache_size': cache_size,
+        'stats': {'requests': 0, 'cache_hits': 0, 'batched': 0, 'expired': 0},
+    }
+
+
+async def warm_pool(server):
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(loop.run_in_executor(server['executor'], _warm_up)
+                           for _ in range(server['workers'])))
+
+
+async def _dispatcher(server):
+    """Consome a fila de análises; um despachante por processo de trabalho."""
+    loop = asyncio.get_running_loop()
+    while True:
+        key, sign, args, expires_at, future = await server['queue'].get()
+        try:
+            remaining = None if expires_at is None else expires_at - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                server['stats']['expired'] += 1
+                future.set_exception(TimeoutError("prazo esgotado na fila"))
+                continue
+            board, player, selected, depth, time_limit = args
+            if remaining is not None:
+                # Reserva uma margem do prazo para a resposta voltar do processo de trabalho.
+                budget = remaining * DEADLINE_SEARCH_FRACTION
+                time_limit = budget if time_limit is None else min(time_limit, budget)
+            try:
+                result = await loop.run_in_executor(
+                    server['executor'], run_analysis, board, player, selected, depth, time_limit)
+            except Exception as error:
+                future.set_exception(error)
+                continue
+            # Resultados ficam na orientação canônica: servem à posição e ao seu espelho.
+            result = orient_result(result, sign)
+            # Só guarda em cache análises que não foram cortadas pelo prazo da requisição.
+            if result['depth'] == depth:
+                cache = server['cache']
+                cache[key] = result
+                if len(cache) > server['cache_size']:
+                    cache.popitem(last=False)
+            future.set_result(result)
+        finally:
+            # Um pedido com prazo maior pode ter substituído esta entrada; só remove a própria.
+            if server['in_flight'].get(key, (None,))[0] is future:
+                del server['in_flight'][key]
+            server['queue'].task_done()
+
+
+async def submit_analysis(server, game_state, depth, time_limit=None, deadline=None):
+    """
+    Agenda uma análise, reutilizando o cache e pedidos idênticos já em andamento.
+    Um pedido só se junta a uma análise pendente cujo prazo não seja menor que o seu, para
+    não receber um resultado encurtado. Uma posição e seu espelho de cores compartilham a
+    chave canônica.
+    """
+    server['stats']['requests'] += 1
+    position, sign = canonical_key(game_state)
+    key = (position, depth, time_limit)
+    cache = server['cache']
+    if key in cache:
+        cache.move_to_end(key)
+        server['stats']['cache_hits'] += 1
+        return dict(orient_result(cache[key], sign), cached=True)
+
+    expires_at = time.monotonic() + deadline if deadline is not None else None
+    pending = server['in_flight'].get(key)
+    if pending is not None and (pending[1] is None or (expires_at is not None and pending[1] >= expires_at)):
+        future = pending[0]
+        server['stats']['batched'] += 1
+    else:
+        future = asyncio.get_running_loop().create_future()
+        server['in_flight'][key] = (future, expires_at)
+        board = [''.join(row) for row in game_state['board']]
+        args = (board, game_state['current_player'], game_state['selected_piece'], depth, time_limit)
+        await server['queue'].put((key, sign, args, expires_at, future))
+
+    if deadline is None:
+        result = await asyncio.shield(future)
+    else:
+        result = await asyncio.wait_for(asyncio.shield(future), deadline)
+    return dict(orient_result(result, sign), cached=False)
+
+
+async def _handle_request(server, line, writer):
+    request_id = None
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("a requisição deve ser um objeto JSON")
+        request_id = request.get('id')
+        if request.get('command') == 'stats':
+            response = dict(server['stats'], queue_depth=server['queue'].qsize(), cache_entries=len(server['cache']))
+        else:
+            game_state, depth, time_limit, deadline = parse_request(request)
+            response = await submit_analysis(server, game_state, depth, time_limit, deadline)
+    except (asyncio.TimeoutError, TimeoutError):
+        response = {'error': 'prazo esgotado'}
+    except (ValueError, TypeError) as error:
+        response = {'error': str(error)}
+    except Exception as error:
+        # Nenhuma requisição fica sem resposta: o cliente esperaria para sempre.
+        print(f"Erro ao processar requisição {request_id!r}: {error!r}")
+        response = {'error': f"erro interno: {error}"}
+    response['id'] = request_id
+    writer.write((json.dumps(response) + '\n').encode())
+    await writer.drain()
+
+
+async def _handle_client(server, reader, writer):
+    tasks = set()
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            # Cada requisição roda em paralelo; as respostas chegam fora de ordem e são casadas pelo id.
+            task = asyncio.create_task(_handle_request(server, line, writer))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        writer.close()
+
+
+async def serve(host='127.0.0.1', port=8765, unix_path=None, workers=None):
+    server = create_server_state(workers)
+    await warm_pool(server)
+    dispatchers = [asyncio.create_task(_dispatcher(server)) for _ in range(server['workers'])]
+
+    def client_connected(reader, writer):
+        return _handle_client(server, reader, writer)
+
+    if unix_path:
+        listener = await asyncio.start_unix_server(client_connected, path=unix_path)
+        print(f"Servidor de análise ouvindo em {unix_path}")
+    else:
+        listener = await asyncio.start_server(client_connected, host=host, port=port)
+        print(f"Servidor de análise ouvindo em {host}:{port}")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        for task in dispatchers:
+            task.cancel()
+        server['executor'].shutdown(cancel_futures=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local de análise do motor de damas")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', dest='unix_path', help="caminho de um socket Unix (em vez de TCP)")
+    parser.add_argument('--workers', type=int, help="número de processos de análise")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix_path, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
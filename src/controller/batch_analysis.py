@@ -0,0 +1,109 @@
+"""
+Análise em lote de posições na notação compacta (src/model/notation.py).
+
+Lê uma posição por linha de um arquivo ou da entrada padrão, distribui as análises por um
+pool de processos e escreve uma linha JSON por posição, na mesma ordem da entrada.
+A leitura é feita sob demanda e só uma janela limitada de blocos fica em andamento,
+então arquivos com milhões de linhas são processados com memória constante.
+
+Uso:
+    python -m src.controller.batch_analysis posicoes.txt --depth 4 > resultados.jsonl
+    cat posicoes.txt | python -m src.controller.batch_analysis --time-limit 0.2 --workers 8
+
+Linhas vazias e comentários ('#') são ignorados.
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from src.model.notation import parse_position, format_move
+from src.controller.ai_controller import analyze_position
+
+DEFAULT_DEPTH = 4
+DEFAULT_CHUNK_SIZE = 32     # Posições por tarefa enviada a um processo
+WINDOW_PER_WORKER = 4       # Blocos em andamento por processo
+
+
+def analyze_chunk(chunk, depth, time_limit):
+    """Executado nos processos de trabalho: devolve uma linha JSON por posição do bloco."""
+    output = []
+    for line_number, text in chunk:
+        record = {'line': line_number, 'position': text}
+        try:
+            game_state = parse_position(text)
+        except ValueError as error:
+            record['error'] = str(error)
+        else:
+            if game_state['game_over']:
+                record['game_over'] = True
+                record['winner'] = game_state['winner']
+            else:
+                result = analyze_position(game_state, depth=depth, time_limit=time_limit)
+                record.update(
+                    best_move=format_move(result['best_move']),
+                    score=result['score'],
+                    pv=[format_move(move) for move in result['pv']],
+                    depth=result['depth'],
+                    nodes=result['nodes'],
+                    time=round(result['time'], 6),
+                )
+        output.append(json.dumps(record, ensure_ascii=False))
+    return output
+
+
+def read_chunks(lines, chunk_size):
+    """Agrupa as posições em blocos de (número_da_linha, texto), lendo a entrada sob demanda."""
+    positions = (
+        (line_number, line.strip())
+        for line_number, line in enumerate(lines, start=1)
+        if line.strip() and not line.lstrip().startswith('#')
+    )
+    while True:
+        chunk = list(itertools.islice(positions, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_batch(lines, output, depth=DEFAULT_DEPTH, time_limit=None, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    workers = workers or os.cpu_count() or 1
+    window = workers * WINDOW_PER_WORKER
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in read_chunks(lines, chunk_size):
+            pending.append(executor.submit(analyze_chunk, chunk, depth, time_limit))
+            # Janela cheia: espera o bloco mais antigo para manter a ordem e a memória limitadas.
+            if len(pending) >= window:
+                _write_chunk(output, pending.popleft().result())
+        while pending:
+            _write_chunk(output, pending.popleft().result())
+
+
+def _write_chunk(output, records):
+    for record in records:
+        output.write(record + '\n')
+    output.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Análise em lote de posições de damas")
+    parser.add_argument('input', nargs='?', help="arquivo de posições (padrão: entrada padrão)")
+    parser.add_argument('--depth', type=int, default=DEFAULT_DEPTH)
+    parser.add_argument('--time-limit', type=float, help="segundos por posição (aprofundamento iterativo)")
+    parser.add_argument('--workers', type=int, help="número de processos")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input, encoding='utf-8') as lines:
+            run_batch(lines, sys.stdout, args.depth, args.time_limit, args.workers, args.chunk_size)
+    else:
+        run_batch(sys.stdin, sys.stdout, args.depth, args.time_limit, args.workers, args.chunk_size)
+
+
+if __name__ == '__main__':
+    main()
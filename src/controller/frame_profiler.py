@@ -0,0 +1,124 @@
+"""
+Perfilador de tempo de quadro do cliente pygame.
+
+Ativado pela variável de ambiente DAMAS_PROFILE=1; desligado, create_frame_profiler devolve
+None e os laços só pagam um teste de None por fase. Cada quadro é dividido em fases
+(ex.: events, update, render, flip) e o perfilador mantém janelas móveis com percentis,
+registra quadros lentos com a fase que estourou e alimenta o overlay do jogo (tecla F3).
+
+DAMAS_PROFILE_SLOW_MS ajusta o limite de quadro lento (padrão: 1,5 quadro a 60 FPS).
+"""
+import os
+import time
+from collections import deque
+
+from src.config.settings import FPS
+
+PROFILE_ENV = 'DAMAS_PROFILE'
+SLOW_FRAME_ENV = 'DAMAS_PROFILE_SLOW_MS'
+WINDOW_FRAMES = 600          # Quadros considerados nos percentis (10 s a 60 FPS)
+SUMMARY_INTERVAL = 30        # Quadros entre recálculos do resumo exibido no overlay
+
+
+def create_frame_profiler(name):
+    """Cria um perfilador para o laço indicado, ou None se o perfil estiver desligado."""
+    if os.environ.get(PROFILE_ENV, '') in ('', '0'):
+        return None
+    default_slow_ms = 1500.0 / FPS
+    try:
+        slow_ms = float(os.environ.get(SLOW_FRAME_ENV, default_slow_ms))
+    except ValueError:
+        print(f"[perfil {name}] {SLOW_FRAME_ENV} inválido; usando {default_slow_ms:.1f} ms")
+        slow_ms = default_slow_ms
+    return {
+        'name': name,
+        'slow_ms': slow_ms,
+        'frames': deque(maxlen=WINDOW_FRAMES),
+        'phases': {},
+        'current': {},
+        'frame_start': None,
+        'phase_start': None,
+        'frame_count': 0,
+        'slow_count': 0,
+        'overlay': False,
+        'summary': None,
+    }
+
+
+def begin_frame(profiler):
+    now = time.perf_counter()
+    profiler['frame_start'] = now
+    profiler['phase_start'] = now
+    profiler['current'] = {}
+
+
+def end_phase(profiler, phase):
+    """Fecha a fase atual, atribuindo a ela o tempo desde o fim da fase anterior."""
+    now = time.perf_counter()
+    current = profiler['current']
+    current[phase] = current.get(phase, 0.0) + (now - profiler['phase_start']) * 1000
+    profiler['phase_start'] = now
+
+
+def end_frame(profiler):
+    total_ms = (time.perf_counter() - profiler['frame_start']) * 1000
+    profiler['frames'].append(total_ms)
+    for phase, elapsed in profiler['current'].items():
+        profiler['phases'].setdefault(phase, deque(maxlen=WINDOW_FRAMES)).append(elapsed)
+    profiler['frame_count'] += 1
+
+    if total_ms > profiler['slow_ms']:
+        profiler['slow_count'] += 1
+        phases = profiler['current']
+        slowest = max(phases, key=phases.get) if phases else '?'
+        detail = ', '.join(f"{phase} {elapsed:.1f}" for phase, elapsed in phases.items())
+        print(f"[perfil {profiler['name']}] quadro lento: {total_ms:.1f} ms "
+              f"(estourou em {slowest}; {detail})")
+
+    if profiler['overlay'] and (profiler['summary'] is None or profiler['frame_count'] % SUMMARY_INTERVAL == 0):
+        profiler['summary'] = frame_summary(profiler)
+
+
+def toggle_overlay(profiler):
+    profiler['overlay'] = not profiler['overlay']
+    profiler['summary'] = frame_summary(profiler) if profiler['overlay'] else None
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
+
+def _stats(values):
+    ordered = sorted(values)
+    return {
+        'p50': _percentile(ordered, 0.50),
+        'p95': _percentile(ordered, 0.95),
+        'p99': _percentile(ordered, 0.99),
+        'max': ordered[-1] if ordered else 0.0,
+    }
+
+
+def frame_summary(profiler):
+    """Percentis (ms) do quadro inteiro e de cada fase na janela móvel."""
+    return {
+        'frames': profiler['frame_count'],
+        'slow_frames': profiler['slow_count'],
+        'frame': _stats(profiler['frames']),
+        'phases': {phase: _stats(values) for phase, values in profiler['phases'].items()},
+    }
+
+
+def report(profiler):
+    """Imprime o resumo final do perfil (chamado ao sair do laço)."""
+    if profiler is None or not profiler['frames']:
+        return
+    summary = frame_summary(profiler)
+    frame = summary['frame']
+    print(f"[perfil {profiler['name']}] {summary['frames']} quadros, {summary['slow_frames']} lentos; "
+          f"quadro p50 {frame['p50']:.1f} p95 {frame['p95']:.1f} p99 {frame['p99']:.1f} máx {frame['max']:.1f} ms")
+    for phase, stats in summary['phases'].items():
+        print(f"[perfil {profiler['name']}]   {phase:8} p50 {stats['p50']:.1f} p95 {stats['p95']:.1f} "
+              f"p99 {stats['p99']:.1f} máx {stats['max']:.1f} ms")
@@ -1,11 +1,14 @@
 import asyncio
 import pygame
-from src.model.game_state import initialize_game, update_game_state
-from src.model.moves import get_valid_moves
+from src.model.game_state import initialize_game, update_game_state, get_legal_piece_moves
+from src.model.moves import move_to
 from src.view.board_view import render_game_state, draw_game_over
 from src.view.menu_view import render_pause_menu, get_button_clicked
-from src.config.settings import WINDOW_WIDTH, WINDOW_HEIGHT, SQUARE_SIZE
-from src.controller.ai_controller import handle_ai_turn
+from src.view.profiler_view import draw_profiler_overlay
+from src.view.display import init_display
+from src.config.settings import SQUARE_SIZE, AI_PONDER
+from src.config.settings_manager import get_ai_difficulty
+from src.controller.frame_profiler import create_frame_profiler, begin_frame, end_phase, end_frame, toggle_overlay, report
 
 async def handle_game_loop(screen, mode='pvp'):
     game_state = initialize_game()
@@ -13,37 +16,85 @@ async def handle_game_loop(screen, mode='pvp'):
     if mode == 'ai':
         game_state['current_player'] = 'RED'
     
+    # A IA (busca, tabelas de transposição, threads de ponderação) só é carregada no modo contra a IA.
+    ai = None
+    if mode == 'ai':
+        from src.controller import ai_controller as ai
+
     clock = pygame.time.Clock()
+    # Ponderação: a IA pensa nas respostas prováveis enquanto o humano joga.
+    ponder = None
+    ponder_enabled = AI_PONDER and mode == 'ai'
+    # Perfil de tempo de quadro (DAMAS_PROFILE=1); None quando desligado.
+    profiler = create_frame_profiler('jogo')
     running = True
-    while running:
-        clock.tick(60)
-        
-        if game_state.get('mode') == 'ai' and game_state['current_player'] == 'BLACK':
-            handle_ai_turn(game_state)
-            render_game_state(screen, game_state)
-            await asyncio.sleep(0.5)
-            continue
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "exit"
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    action = await handle_pause_menu(screen)
-                    if action:
-                        return action
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                handle_game_input(event, game_state)
-        
-        render_game_state(screen, game_state)
-        
-        if game_state.get('game_over'):
-            draw_game_over(screen, game_state.get('winner', 'Ninguém'))
-            await asyncio.sleep(2)
-            return "menu"
-        
-        pygame.display.flip()
-        await asyncio.sleep(0)
+    try:
+        while running:
+            clock.tick(60)
+            if profiler:
+                begin_frame(profiler)
+            
+            if game_state.get('mode') == 'ai' and game_state['current_player'] == 'BLACK':
+                ai.handle_ai_turn(game_state, ponder)
+                ponder = None
+                if profiler:
+                    end_phase(profiler, 'ai')
+                render_game_state(screen, game_state, flip=False)
+                if profiler:
+                    end_phase(profiler, 'render')
+                pygame.display.flip()
+                if profiler:
+                    end_phase(profiler, 'flip')
+                    end_frame(profiler)
+                await asyncio.sleep(0.5)
+                continue
+            
+            events = pygame.event.get()
+            if profiler:
+                end_phase(profiler, 'events')
+            
+            for event in events:
+                if event.type == pygame.QUIT:
+                    return "exit"
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        action = await handle_pause_menu(screen)
+                        if action:
+                            return action
+                        if profiler:
+                            begin_frame(profiler)  # O tempo no menu de pausa não conta como quadro
+                    elif event.key == pygame.K_F3 and profiler:
+                        toggle_overlay(profiler)
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    handle_game_input(event, game_state)
+            
+            if (ponder_enabled and ponder is None and not game_state.get('game_over') and
+                    game_state['current_player'] == 'RED'):
+                ponder = ai.start_pondering(game_state, get_ai_difficulty())
+                ponder_enabled = ponder is not None
+            if profiler:
+                end_phase(profiler, 'update')
+            
+            render_game_state(screen, game_state, flip=False)
+            if profiler and profiler['overlay']:
+                draw_profiler_overlay(screen, profiler['summary'])
+            if profiler:
+                end_phase(profiler, 'render')
+            
+            if game_state.get('game_over'):
+                draw_game_over(screen, game_state.get('winner', 'Ninguém'))
+                await asyncio.sleep(2)
+                return "menu"
+            
+            pygame.display.flip()
+            if profiler:
+                end_phase(profiler, 'flip')
+                end_frame(profiler)
+            await asyncio.sleep(0)
+    finally:
+        if ai is not None:
+            ai.stop_pondering(ponder)
+        report(profiler)
     
     return "exit"
 
@@ -62,10 +113,11 @@ def handle_game_input(event, game_state):
         piece = board[row][col]
         
         if piece.lower() == current_player[0].lower():
-            valid_moves = get_valid_moves(board, row, col)
+            valid_moves, must_capture = get_legal_piece_moves(board, current_player, row, col)
             if valid_moves:
                 game_state['selected_piece'] = (row, col)
                 game_state['valid_moves'] = valid_moves
+                game_state['must_capture'] = must_capture
             else:
                 return
         else:
@@ -79,11 +131,11 @@ def handle_game_input(event, game_state):
         
         valid_move = None
         for move in game_state['valid_moves']:
-            if move[0] == row and move[1] == col:
+            if move_to(move) == (row, col):
                 valid_move = move
                 break
         
-        if valid_move:
+        if valid_move is not None:
             update_game_state(game_state, valid_move)
         else:
             if not game_state.get('must_capture'):
@@ -106,13 +158,11 @@ async def handle_pause_menu(screen):
         await asyncio.sleep(0)
 
 async def start_game():
-    pygame.init()
-    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    screen = init_display()
     result = await handle_game_loop(screen, mode='pvp')
     return result
 
 async def start_ai_game():
-    pygame.init()
-    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    screen = init_display()
     result = await handle_game_loop(screen, mode='ai')
     return result
\ No newline at end of file
@@ -1,21 +1,39 @@
 import asyncio 
 import pygame
 from src.view.menu_view import render_menu, render_settings_menu, get_button_clicked
-from src.controller.game_controller import start_game, start_ai_game
 from src.config.settings_manager import set_ai_difficulty
+from src.controller.frame_profiler import create_frame_profiler, begin_frame, end_phase, end_frame, report
 
 
 async def handle_main_menu(screen):
+    # Perfil de tempo de quadro (DAMAS_PROFILE=1); None quando desligado.
+    profiler = create_frame_profiler('menu')
+    try:
+        return await _run_main_menu(screen, profiler)
+    finally:
+        report(profiler)
+
+
+async def _run_main_menu(screen, profiler):
     running = True
     while running:
-        button_positions = render_menu(screen)
+        if profiler:
+            begin_frame(profiler)
+        button_positions = render_menu(screen, flip=False)
+        if profiler:
+            end_phase(profiler, 'render')
         
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if profiler:
+            end_phase(profiler, 'events')
+        for event in events:
             if event.type == pygame.QUIT:
                 return "exit"
             if event.type == pygame.MOUSEBUTTONDOWN:
                 action = get_button_clicked(button_positions, event.pos)
                 if action:
+                    # Importado no primeiro clique: o menu abre sem carregar o jogo nem a IA.
+                    from src.controller.game_controller import start_game, start_ai_game
                     if action == "pvp":
                         result = await start_game()
                         if result == "exit":
@@ -30,15 +48,20 @@ async def handle_main_menu(screen):
                             return "exit"
                     elif action == "exit":
                         return "exit"
+                    if profiler:
+                        begin_frame(profiler)  # Partidas e submenus não contam como quadro do menu
 
         pygame.display.flip()
+        if profiler:
+            end_phase(profiler, 'flip')
+            end_frame(profiler)
         await asyncio.sleep(0)
 
 
 async def handle_difficulty_menu(screen):
     running = True
     while running:
-        button_positions = render_settings_menu(screen)
+        button_positions = render_settings_menu(screen, flip=False)
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -0,0 +1,240 @@
+"""
+Resolvedor por números de prova (df-pn) para posições táticas.
+
+Em vez de explorar todos os ramos até a mesma profundidade, como o minimax, a busca df-pn
+segue sempre o ramo mais barato de provar ou refutar: o número de prova (pn) de um nó é
+quantas folhas ainda faltam para provar a vitória do atacante (o jogador da vez na raiz) e o
+número de refutação (dn), quantas faltam para refutá-la. Nos nós do atacante basta um filho
+provado (pn = mínimo dos filhos, dn = soma); nos do defensor todos precisam ser provados
+(pn = soma, dn = mínimo). Com captura obrigatória, as linhas forçadas têm poucos ramos e são
+provadas com muito menos nós que a busca de profundidade fixa.
+
+As regras vêm de src/model/moves.py e update_game_state: cadeias de captura continuam com o
+mesmo jogador, e empates (repetição, lances sem progresso) contam como refutação.
+Os números ficam em uma tabela limitada (LRU) indexada pelo hash de Zobrist; o orçamento
+de nós (e o prazo opcional) limita o tempo e o tamanho máximo da tabela limita a memória.
+
+solve_position devolve 'win', 'loss' ou 'unknown' (empate, orçamento esgotado) e a linha
+que prova o resultado.
+"""
+import time
+from collections import OrderedDict
+from copy import deepcopy
+
+from src.model.game_state import update_game_state
+from src.model.moves import generate_moves
+
+INFINITY = 10 ** 9
+DEFAULT_MAX_NODES = 20000
+DEFAULT_TABLE_ENTRIES = 100000
+MAX_LINE_PLIES = 200
+
+
+class SolverBudgetExceeded(Exception):
+    """Levantada quando o resolvedor esgota o orçamento de nós ou é interrompido."""
+
+
+def _new_solver(attacker, max_nodes, max_entries, stop=None, deadline=None):
+    return {
+        'attacker': attacker,
+        'max_nodes': max_nodes,
+        'max_entries': max_entries,
+        'stop': stop,
+        'deadline': deadline,
+        'nodes': 0,
+        'table': OrderedDict(),
+        'evictions': 0,
+    }
+
+
+def _node_key(state):
+    # O hash de Zobrist já inclui o jogador da vez; a peça em captura distingue o meio da cadeia.
+    # Posições empatadas pelo histórico (repetição, lances sem progresso) têm entrada própria,
+    # para não contaminar a mesma posição alcançada por outro caminho.
+    drawn = bool(state.get('draw')) or state.get('repetitions', 0) > 1
+    return (state['hash'], state.get('selected_piece'), drawn)
+
+
+def _legal_moves(state):
+    if state.get('selected_piece') is not None:
+        return list(state.get('valid_moves', []))
+    return list(generate_moves(state['board'], state['current_player']))
+
+
+def _terminal_numbers(solver, state, repetition_draw=True):
+    """
+    (pn, dn) de uma posição terminal, ou None se o jogo continua. Na raiz repetition_draw é
+    False: uma repetição vinda da partida não encerra a posição a resolver.
+    """
+    if state.get('draw') or (repetition_draw and state.get('repetitions', 0) > 1):
+        # Empate (ou repetição dentro da linha, como na busca principal): não é vitória de ninguém.
+        return INFINITY, 0
+    if state.get('game_over'):
+        # Sem peças ou sem jogadas: quem perde é sempre o jogador da vez.
+        if state['current_player'] == solver['attacker']:
+            return INFINITY, 0
+        return 0, INFINITY
+    return None
+
+
+def _count_node(solver):
+    solver['nodes'] += 1
+    if solver['nodes'] > solver['max_nodes']:
+        raise SolverBudgetExceeded()
+    stop = solver['stop']
+    if stop is not None and stop.is_set():
+        raise SolverBudgetExceeded()
+    deadline = solver['deadline']
+    if deadline is not None and time.perf_counter() >= deadline:
+        raise SolverBudgetExceeded()
+
+
+def _lookup(solver, key):
+    entry = solver['table'].get(key)
+    if entry is None:
+        return 1, 1
+    solver['table'].move_to_end(key)
+    return entry
+
+
+def _store(solver, key, pn, dn):
+    table = solver['table']
+    table[key] = (pn, dn)
+    table.move_to_end(key)
+    if len(table) > solver['max_entries']:
+        table.popitem(last=False)
+        solver['evictions'] += 1
+
+
+def _collect(solver, children, or_node):
+    """
+    Combina os números dos filhos. Retorna (pn, dn, índice do filho mais promissor,
+    segundo melhor valor) — o valor comparado é o pn nos nós do atacante e o dn nos do defensor.
+    """
+    best_index = None
+    best_value = second_value = INFINITY
+    total = 0
+    for index, (_, _, child_key) in enumerate(children):
+        child_pn, child_dn = _lookup(solver, child_key)
+        value, other = (child_pn, child_dn) if or_node else (child_dn, child_pn)
+        total = min(INFINITY, total + other)
+        if best_index is None or value < best_value:
+            second_value = best_value
+            best_index, best_value = index, value
+        elif value < second_value:
+            second_value = value
+    if or_node:
+        return best_value, total, best_index, second_value
+    return total, best_value, best_index, second_value
+
+
+def _mid(solver, state, pn_threshold, dn_threshold, root=False):
+    """Expande o nó até que seu pn ou dn alcance o limite recebido (Multiple Iterative Deepening)."""
+    key = _node_key(state)
+    terminal = _terminal_numbers(solver, state, repetition_draw=not root)
+    if terminal is not None:
+        _store(solver, key, *terminal)
+        return
+
+    children = []
+    for move in _legal_moves(state):
+        _count_node(solver)
+        child = deepcopy(state)
+        update_game_state(child, move)
+        child_key = _node_key(child)
+        terminal = _terminal_numbers(solver, child)
+        if terminal is not None:
+            _store(solver, child_key, *terminal)
+        children.append((move, child, child_key))
+    if not children:
+        # Sem jogadas: o jogador da vez perde.
+        numbers = (INFINITY, 0) if state['current_player'] == solver['attacker'] else (0, INFINITY)
+        _store(solver, key, *numbers)
+        return
+
+    or_node = state['current_player'] == solver['attacker']
+    while True:
+        pn, dn, best_index, second_value = _collect(solver, children, or_node)
+        if pn >= pn_threshold or dn >= dn_threshold:
+            break
+        _, child, child_key = children[best_index]
+        child_pn, child_dn = _lookup(solver, child_key)
+        if or_node:
+            child_pn_threshold = min(pn_threshold, second_value + 1)
+            child_dn_threshold = dn_threshold - dn + child_dn
+        else:
+            child_pn_threshold = pn_threshold - pn + child_pn
+            child_dn_threshold = min(dn_threshold, second_value + 1)
+        _mid(solver, child, child_pn_threshold, child_dn_threshold)
+    _store(solver, key, pn, dn)
+
+
+def _prove(solver, game_state):
+    """True se a vitória do atacante foi provada, False se refutada, None se o orçamento acabou."""
+    try:
+        _mid(solver, game_state, INFINITY, INFINITY, root=True)
+    except SolverBudgetExceeded:
+        return None
+    pn, _ = _lookup(solver, _node_key(game_state))
+    return pn == 0
+
+
+def _proof_line(solver, game_state):
+    """
+    Reconstrói a linha provada a partir da tabela: o atacante escolhe um filho provado e o
+    defensor qualquer resposta (todas estão provadas). Para antes se a tabela perdeu entradas.
+    """
+    line = []
+    state = deepcopy(game_state)
+    while len(line) < MAX_LINE_PLIES and _terminal_numbers(solver, state, repetition_draw=not line) is None:
+        chosen = None
+        for move in _legal_moves(state):
+            child = deepcopy(state)
+            update_game_state(child, move)
+            numbers = _terminal_numbers(solver, child) or solver['table'].get(_node_key(child))
+            if numbers is not None and numbers[0] == 0:
+                chosen = (move, child)
+                break
+        if chosen is None:
+            break
+        line.append(chosen[0])
+        state = chosen[1]
+    return line
+
+
+def solve_position(game_state, max_nodes=DEFAULT_MAX_NODES, max_entries=DEFAULT_TABLE_ENTRIES, stop=None,
+                   deadline=None):
+    """
+    Tenta provar o resultado da posição para o jogador da vez.
+
+    max_nodes limita as posições geradas (somando as duas provas) e max_entries o tamanho da
+    tabela de números de prova; stop (threading.Event) e deadline (time.perf_counter())
+    interrompem a busca. Retorna um dict com
+    result ('win', 'loss' ou 'unknown'), line (jogadas codificadas da linha provada), nodes,
+    time e evictions.
+    """
+    start = time.perf_counter()
+    player = game_state['current_player']
+    opponent = 'BLACK' if player == 'RED' else 'RED'
+
+    solver = _new_solver(player, max_nodes, max_entries, stop, deadline)
+    proven = _prove(solver, game_state)
+    result, line = 'unknown', []
+    nodes, evictions = solver['nodes'], solver['evictions']
+    if proven:
+        result, line = 'win', _proof_line(solver, game_state)
+    elif proven is False:
+        # A vitória foi refutada: resta saber se é derrota forçada ou só empate.
+        solver = _new_solver(opponent, max_nodes - nodes, max_entries, stop, deadline)
+        if _prove(solver, game_state):
+            result, line = 'loss', _proof_line(solver, game_state)
+        nodes += solver['nodes']
+        evictions += solver['evictions']
+
+    return {
+        'result': result,
+        'line': line,
+        'nodes': nodes,
+        'time': time.perf_counter() - start,
+        'evictions': evictions,
+    }
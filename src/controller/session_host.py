@@ -0,0 +1,242 @@
+"""
+Hospedeiro de sessões: muitas partidas jogador-contra-IA independentes em um único processo, sem pygame.
+
+Cada sessão guarda seu próprio game_state e é identificada por um id. As jogadas do humano
+chegam pela API asyncio (play_move); os turnos da IA vão para um pool compartilhado e limitado
+de processos. O agendamento é justo: cada passo da IA (um lance, ou um salto de uma cadeia de
+captura) entra no fim de uma fila FIFO, então nenhuma sessão monopoliza os processos.
+O orçamento de tempo vale para o turno inteiro: os saltos de uma cadeia dividem o que sobrou.
+
+As tabelas somente-leitura do motor (peça-casa, Zobrist) são construídas uma vez por processo
+de trabalho na importação e compartilhadas por todas as sessões atendidas por ele.
+
+Exemplo:
+    host = create_session_host(workers=4)
+    await start_session_host(host)
+    session_id = create_session(host)
+    status = await play_move(host, session_id, (5, 0), (4, 1))
+    print(host_metrics(host))
+    await shutdown_session_host(host)
+"""
+import asyncio
+import itertools
+import statistics
+import time
+from collections import deque
+from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
+
+from src.config.settings import AI_DIFFICULTY
+from src.model.game_state import initialize_game, update_game_state, get_legal_piece_moves
+from src.model.moves import move_from, move_to
+from src.controller.ai_controller import analyze_position, remember_proof_line
+from src.controller.analysis_server import warm_pool
+
+DEFAULT_TIME_BUDGET = 1.0   # Segundos por turno da IA em cada sessão
+MIN_STEP_BUDGET = 0.05      # Tempo mínimo de um salto, mesmo com o orçamento do turno esgotado
+LATENCY_WINDOW = 100        # Quantos turnos da IA entram nas métricas de latência
+
+
+def _search_worker(game_state, depth, time_limit):
+    # Executado nos processos de trabalho. O estado vai inteiro, com o histórico de posições,
+    # para que a busca enxergue repetições da partida.
+    result = analyze_position(game_state, depth=depth, time_limit=time_limit)
+    return result['best_move'], result['proof_line']
+
+
+def create_session_host(workers=1, depth=AI_DIFFICULTY, time_budget=DEFAULT_TIME_BUDGET):
+    return {
+        'executor': ProcessPoolExecutor(max_workers=workers),
+        'workers': workers,
+        'depth': depth,
+        'time_budget': time_budget,
+        'sessions': {},
+        'ready': None,          # Fila FIFO de sessões aguardando um passo da IA
+        'slots': None,          # Semáforo com um lugar por processo de trabalho
+        'busy': 0,
+        'scheduler': None,
+        'tasks': set(),         # Passos da IA em andamento (referências contra a coleta de lixo)
+        'ids': itertools.count(1),
+    }
+
+
+async def start_session_host(host):
+    host['ready'] = asyncio.Queue()
+    host['slots'] = asyncio.Semaphore(host['workers'])
+    await warm_pool(host)
+    host['scheduler'] = asyncio.create_task(_scheduler(host))
+
+
+async def shutdown_session_host(host):
+    """
+    Encerra o agendador e os passos em andamento. Turnos da IA ainda pendentes (em busca ou
+    na fila) terminam com erro, então nenhum play_move fica aguardando para sempre.
+    """
+    if host['scheduler'] is not None:
+        host['scheduler'].cancel()
+    for task in list(host['tasks']):
+        task.cancel()
+    for session in host['sessions'].values():
+        if session['ai_turn'] is not None and not session['ai_turn'].done():
+            session['state'] = session['turn_start_state']
+            session['ai_moves'] = []
+            session['ai_turn'].set_exception(RuntimeError("hospedeiro de sessões encerrado"))
+    # Sem esperar os processos: shutdown(wait=True) bloquearia o laço de eventos.
+    host['executor'].shutdown(wait=False, cancel_futures=True)
+
+
+def create_session(host, session_id=None, depth=None, time_budget=None):
+    """Cria uma partida nova (humano com as vermelhas) e devolve o id da sessão."""
+    if session_id is None:
+        session_id = str(next(host['ids']))
+    if session_id in host['sessions']:
+        raise ValueError(f"sessão já existe: {session_id}")
+    game_state = initialize_game()
+    game_state['mode'] = 'ai'
+    host['sessions'][session_id] = {
+        'id': session_id,
+        'state': game_state,
+        'depth': depth or host['depth'],
+        'time_budget': time_budget if time_budget is not None else host['time_budget'],
+        'ai_turn': None,        # Future resolvido quando o turno da IA termina
+        'ai_turn_started': None,
+        'turn_search_time': 0.0,    # Tempo de busca já gasto no turno atual da IA
+        'turn_start_state': None,   # Estado antes da jogada do humano, restaurado se a IA falhar
+        'ai_moves': [],
+        'latencies': deque(maxlen=LATENCY_WINDOW),
+        'ai_turns': 0,
+    }
+    return session_id
+
+
+def close_session(host, session_id):
+    session = host['sessions'].pop(session_id)
+    if session['ai_turn'] is not None and not session['ai_turn'].done():
+        session['ai_turn'].cancel()
+
+
+def session_status(session):
+    game_state = session['state']
+    return {
+        'session_id': session['id'],
+        'board': [''.join(row) for row in game_state['board']],
+        'current_player': game_state['current_player'],
+        'selected_piece': game_state['selected_piece'],
+        'game_over': game_state['game_over'],
+        'winner': game_state['winner'],
+        'draw': game_state.get('draw', False),
+        'ai_moves': list(session['ai_moves']),
+    }
+
+
+async def play_move(host, session_id, from_pos, to_pos):
+    """
+    Aplica uma jogada do humano e, se o turno passar para a IA, aguarda a resposta dela.
+    Em cadeias de captura, cada salto é uma chamada; from_pos deve ser a peça da cadeia.
+    Levanta ValueError para jogadas ilegais ou fora de turno. Se a busca da IA falhar, o erro
+    é repassado e a sessão volta ao estado anterior à jogada, que pode ser repetida.
+    """
+    session = host['sessions'][session_id]
+    game_state = session['state']
+    if game_state['game_over']:
+        raise ValueError("a partida já terminou")
+    if game_state['current_player'] != 'RED':
+        raise ValueError("não é a vez do jogador")
+
+    from_pos = tuple(from_pos)
+    if game_state['selected_piece'] is not None:
+        if from_pos != game_state['selected_piece']:
+            raise ValueError("a cadeia de captura deve continuar com a mesma peça")
+        valid_moves = game_state['valid_moves']
+    else:
+        valid_moves, _ = get_legal_piece_moves(game_state['board'], 'RED', *from_pos)
+    move = next((m for m in valid_moves if move_to(m) == tuple(to_pos)), None)
+    if move is None:
+        raise ValueError("jogada ilegal")
+
+    turn_start_state = deepcopy(game_state)
+    game_state['selected_piece'] = from_pos
+    game_state['valid_moves'] = valid_moves
+    update_game_state(game_state, move)
+
+    session['ai_moves'] = []
+    if game_state['current_player'] == 'BLACK' and not game_state['game_over']:
+        session['ai_turn'] = asyncio.get_running_loop().create_future()
+        session['ai_turn_started'] = time.perf_counter()
+        session['turn_search_time'] = 0.0
+        session['turn_start_state'] = turn_start_state
+        await host['ready'].put(session)
+        await session['ai_turn']
+    return session_status(session)
+
+
+async def _scheduler(host):
+    """Despacha um passo da IA por vez para cada processo livre, na ordem de chegada."""
+    while True:
+        await host['slots'].acquire()
+        session = await host['ready'].get()
+        if session['id'] not in host['sessions']:
+            host['slots'].release()
+            continue
+        task = asyncio.create_task(_run_ai_step(host, session))
+        host['tasks'].add(task)
+        task.add_done_callback(host['tasks'].discard)
+
+
+async def _run_ai_step(host, session):
+    loop = asyncio.get_running_loop()
+    host['busy'] += 1
+    time_limit = max(MIN_STEP_BUDGET, session['time_budget'] - session['turn_search_time'])
+    started = time.perf_counter()
+    try:
+        best_move, proof_line = await loop.run_in_executor(
+            host['executor'], _search_worker, session['state'], session['depth'], time_limit)
+    except Exception as error:
+        # Volta a sessão para antes da jogada do humano, que pode repeti-la; sem isso a
+        # sessão ficaria com as pretas na vez e nenhum turno da IA pendente.
+        session['state'] = session['turn_start_state']
+        session['ai_moves'] = []
+        if not session['ai_turn'].done():
+            session['ai_turn'].set_exception(error)
+        return
+    finally:
+        session['turn_search_time'] += time.perf_counter() - started
+        host['busy'] -= 1
+        host['slots'].release()
+
+    game_state = session['state']
+    if best_move is not None:
+        game_state['selected_piece'] = move_from(best_move)
+        game_state['valid_moves'] = [best_move]
+        update_game_state(game_state, best_move)
+        remember_proof_line(game_state, proof_line, best_move)
+        session['ai_moves'].append((move_from(best_move), move_to(best_move)))
+
+    if best_move is not None and game_state['current_player'] == 'BLACK' and not game_state['game_over']:
+        # Cadeia de captura: o próximo salto volta para o fim da fila.
+        await host['ready'].put(session)
+        return
+    session['ai_turns'] += 1
+    session['latencies'].append(time.perf_counter() - session['ai_turn_started'])
+    if not session['ai_turn'].done():
+        session['ai_turn'].set_result(None)
+
+
+def session_metrics(session):
+    latencies = sorted(session['latencies'])
+    metrics = {'ai_turns': session['ai_turns'], 'last_latency': None, 'mean_latency': None, 'p95_latency': None}
+    if latencies:
+        metrics['last_latency'] = session['latencies'][-1]
+        metrics['mean_latency'] = statistics.fmean(latencies)
+        metrics['p95_latency'] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    return metrics
+
+
+def host_metrics(host):
+    return {
+        'sessions': len(host['sessions']),
+        'queue_depth': host['ready'].qsize() if host['ready'] is not None else 0,
+        'busy_workers': host['busy'],
+        'workers': host['workers'],
+        'per_session': {session_id: session_metrics(session) for session_id, session in host['sessions'].items()},
+    }
@@ -0,0 +1,52 @@
+"""
+Tabelas pré-calculadas do motor em um arquivo binário compacto.
+
+engine_tables.bin guarda as chaves de Zobrist como inteiros de 64 bits little-endian, na
+ordem: peças 'r', 'R', 'b', 'B' (64 casas cada, linha a linha) e a chave de vez das pretas.
+Ler o arquivo com array('Q') é mais rápido que sortear as chaves na importação, o que conta
+na abertura do build web. O arquivo é gerado por python -m src.prepare_build; se estiver
+ausente ou com tamanho errado, as tabelas são sorteadas como antes, com a mesma semente.
+"""
+import os
+import random
+import sys
+from array import array
+
+TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'engine_tables.bin')
+PIECES = 'rRbB'
+_SQUARES = 64
+_TABLE_LENGTH = len(PIECES) * _SQUARES + 1
+
+# Semente fixa: os hashes são estáveis entre execuções e processos.
+ZOBRIST_SEED = 0x5EED_DA4A5
+
+
+def build_zobrist_keys():
+    """Sorteia as chaves de Zobrist no layout do arquivo binário."""
+    rng = random.Random(ZOBRIST_SEED)
+    keys = array('Q', (rng.getrandbits(64) for _ in range(len(PIECES) * _SQUARES)))
+    keys.append(rng.getrandbits(64))
+    return keys
+
+
+def write_tables(path=TABLES_PATH):
+    keys = build_zobrist_keys()
+    if sys.byteorder != 'little':
+        keys.byteswap()
+    with open(path, 'wb') as f:
+        keys.tofile(f)
+
+
+def load_zobrist_keys(path=TABLES_PATH):
+    """Lê as chaves do arquivo binário, ou as sorteia se o arquivo não puder ser usado."""
+    keys = array('Q')
+    try:
+        with open(path, 'rb') as f:
+            keys.frombytes(f.read())
+    except (OSError, ValueError):
+        return build_zobrist_keys()
+    if len(keys) != _TABLE_LENGTH:
+        return build_zobrist_keys()
+    if sys.byteorder != 'little':
+        keys.byteswap()
+    return keys
@@ -0,0 +1,66 @@
+"""
+Avaliação por tabelas peça-casa (piece-square tables).
+
+Os valores são inteiros em centésimos de peça (uma peça simples vale 100) e positivos
+favorecem as pretas. As tabelas estão escritas do ponto de vista das pretas, que começam
+nas linhas de cima e avançam para baixo; para as vermelhas a tabela é girada em 180°.
+
+O placar de um tabuleiro é mantido incrementalmente em game_state['eval_score'] por
+update_game_state, de forma que avaliar uma folha da busca custe O(1).
+"""
+
+MAN_VALUE = 100
+KING_VALUE = 150
+TEMPO_BONUS = 3  # Bônus para o lado que tem a vez
+
+# Peças simples: avanço em direção à promoção, controle do centro e defesa da linha de fundo.
+MAN_TABLE = [
+    [ 8,  8,  8,  8,  8,  8,  8,  8],   # linha de fundo: impede promoções adversárias
+    [ 0,  1,  2,  3,  3,  2,  1,  0],
+    [ 2,  3,  5,  6,  6,  5,  3,  2],
+    [ 4,  5,  7,  8,  8,  7,  5,  4],
+    [ 6,  7,  9, 10, 10,  9,  7,  6],
+    [ 9, 10, 12, 13, 13, 12, 10,  9],
+    [12, 13, 15, 16, 16, 15, 13, 12],
+    [ 0,  0,  0,  0,  0,  0,  0,  0],   # nunca ocupada: a peça é promovida
+]
+
+# Damas: preferem o centro, de onde controlam as diagonais longas.
+KING_TABLE = [
+    [0, 1, 2, 3, 3, 2, 1, 0],
+    [1, 3, 4, 5, 5, 4, 3, 1],
+    [2, 4, 6, 7, 7, 6, 4, 2],
+    [3, 5, 7, 9, 9, 7, 5, 3],
+    [3, 5, 7, 9, 9, 7, 5, 3],
+    [2, 4, 6, 7, 7, 6, 4, 2],
+    [1, 3, 4, 5, 5, 4, 3, 1],
+    [0, 1, 2, 3, 3, 2, 1, 0],
+]
+
+
+def _build_piece_square_values():
+    values = {}
+    for piece, base, table in (('b', MAN_VALUE, MAN_TABLE), ('B', KING_VALUE, KING_TABLE)):
+        values[piece] = [[base + table[r][c] for c in range(8)] for r in range(8)]
+    for piece, base, table in (('r', MAN_VALUE, MAN_TABLE), ('R', KING_VALUE, KING_TABLE)):
+        values[piece] = [[-(base + table[7 - r][7 - c]) for c in range(8)] for r in range(8)]
+    return values
+
+
+# PIECE_SQUARE_VALUES[peça][linha][coluna]: valor com sinal (material + posição) da peça naquela casa.
+PIECE_SQUARE_VALUES = _build_piece_square_values()
+
+
+def evaluate_board(board):
+    """Calcula do zero o placar peça-casa de um tabuleiro."""
+    score = 0
+    for row in range(len(board)):
+        for col in range(len(board)):
+            piece = board[row][col]
+            if piece != '.':
+                score += PIECE_SQUARE_VALUES[piece][row][col]
+    return score
+
+
+def square_value(piece, row, col):
+    return PIECE_SQUARE_VALUES[piece][row][col]
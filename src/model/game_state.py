@@ -1,5 +1,9 @@
 from .board import create_board, initialize_pieces
-from .moves import get_valid_moves, get_piece_captures, has_captures_available
+from .moves import (get_valid_moves, get_piece_captures, generate_moves, move_from, move_to,
+                    move_capture_count, move_captures)
+from .evaluation import evaluate_board, square_value
+from .zobrist import hash_position, hash_mirror_position, piece_hash, mirror_piece_hash, ZOBRIST_BLACK_TO_MOVE
+from src.config import settings
 
 def initialize_game():
     """
@@ -18,32 +22,93 @@ def initialize_game():
         'game_over': False,
         'winner': None,
         'must_capture': False,
+        'eval_score': evaluate_board(board),  # Placar peça-casa mantido incrementalmente
+        'draw': False,
     }
+    _reset_position_history(game_state)
+    return game_state
+
+def _reset_position_history(game_state):
+    """
+    Inicia o histórico de posições: hash de Zobrist da posição atual, contador de ocorrências
+    por hash e contador de lances sem captura nem movimento de peça simples.
+    """
+    game_state['hash'] = hash_position(game_state['board'], game_state['current_player'])
+    game_state['mirror_hash'] = hash_mirror_position(game_state['board'], game_state['current_player'])
+    game_state['position_counts'] = {game_state['hash']: 1}
+    game_state['repetitions'] = 1
+    game_state['quiet_plies'] = 0
+
+def game_state_from_position(rows, current_player='BLACK', selected_piece=None):
+    """
+    Cria um estado de jogo a partir de uma posição arbitrária (ex.: vinda de uma ferramenta externa).
+    rows é uma sequência de 8 linhas com '.', 'r', 'R', 'b' ou 'B'.
+    selected_piece é a peça em meio a uma cadeia de captura, se houver.
+    Levanta ValueError se a posição ou a peça em captura forem inválidas.
+    """
+    board = [list(row) for row in rows]
+    for row in range(len(board)):
+        for col in range(len(board)):
+            if board[row][col] != '.' and (row + col) % 2 == 0:
+                raise ValueError(f"peça em casa clara: ({row}, {col})")
+    game_state = {
+        'board': board,
+        'current_player': current_player,
+        'selected_piece': None,
+        'valid_moves': [],
+        'original_valid_moves': [],
+        'last_move': None,
+        'game_over': False,
+        'winner': None,
+        'must_capture': False,
+        'eval_score': evaluate_board(board),
+        'draw': False,
+    }
+    _reset_position_history(game_state)
+    if selected_piece is not None:
+        row, col = selected_piece
+        if not (isinstance(row, int) and isinstance(col, int) and
+                0 <= row < len(board) and 0 <= col < len(board)):
+            raise ValueError(f"peça em captura fora do tabuleiro: {selected_piece!r}")
+        owner = 'r' if current_player == 'RED' else 'b'
+        if board[row][col].lower() != owner:
+            raise ValueError(f"a casa ({row}, {col}) não tem uma peça do jogador da vez")
+        game_state['selected_piece'] = (row, col)
+        game_state['valid_moves'] = get_valid_moves(board, row, col, chain_capture=True)
+    check_game_over(game_state)
     return game_state
 
 def update_game_state(game_state, move):
     """
     Atualiza o estado do jogo após um movimento ser executado.
-    O movimento é uma tupla de 4 elementos: (dest_row, dest_col, move_value, captured_positions).
-    - move_value == 0 indica um movimento sem captura.
-    - Um número inteiro positivo indica um movimento de captura (o número de peças capturadas).
+    O movimento é uma jogada codificada (ver moves.encode_move) com origem, destino e capturas;
+    move_capture_count(move) == 0 indica um movimento sem captura.
     
     Para capturas parciais, o turno termina imediatamente após o movimento.
     """
     # Obtém o quadrado inicial do movimento.
-    selected = game_state.get('selected_piece')
-    if not selected:
-        return game_state  # Nada a fazer se nenhuma peça estiver selecionada.
-    
-    dest_row, dest_col, move_value, captured_positions = move
+    selected = move_from(move)
+    dest_row, dest_col = move_to(move)
+    move_value = move_capture_count(move)
+    captured_positions = move_captures(move) if move_value else None
     board = game_state['board']
     piece = board[selected[0]][selected[1]]
     
     board[selected[0]][selected[1]] = '.'
+    # Variação do placar peça-casa: a peça sai da origem e as capturadas saem do tabuleiro.
+    eval_delta = -square_value(piece, selected[0], selected[1])
+    position_hash = game_state.get('hash', 0) ^ piece_hash(piece, selected[0], selected[1])
+    mirror_hash = game_state.get('mirror_hash', 0) ^ mirror_piece_hash(piece, selected[0], selected[1])
+    # Capturas e movimentos de peças simples são irreversíveis: zeram a contagem para empate.
+    irreversible = move_value > 0 or piece.islower()
     
     # Se for um movimento de captura, remove todas as peças capturadas.
     if captured_positions:
         for pos in captured_positions:
+            captured = board[pos[0]][pos[1]]
+            eval_delta -= square_value(captured, pos[0], pos[1])
+            position_hash ^= piece_hash(captured, pos[0], pos[1])
+            mirror_hash ^= mirror_piece_hash(captured, pos[0], pos[1])
             board[pos[0]][pos[1]] = '.'
     
     # Verificação de promoção para dama:
@@ -57,6 +122,13 @@ def update_game_state(game_state, move):
     
     # Coloca a peça em movimento no seu destino.
     board[dest_row][dest_col] = piece
+    eval_delta += square_value(piece, dest_row, dest_col)
+    position_hash ^= piece_hash(piece, dest_row, dest_col)
+    mirror_hash ^= mirror_piece_hash(piece, dest_row, dest_col)
+    if 'eval_score' in game_state:
+        game_state['eval_score'] += eval_delta
+    else:
+        game_state['eval_score'] = evaluate_board(board)
     game_state['last_move'] = (selected, (dest_row, dest_col))
     
     # Flag para verificar se há mais capturas disponíveis
@@ -74,8 +146,7 @@ def update_game_state(game_state, move):
         
         # Encontra a contagem máxima de capturas da posição original
         for vm in original_valid_moves:
-            if isinstance(vm[2], int) and vm[2] > max_capture_from_start:
-                max_capture_from_start = vm[2]
+            max_capture_from_start = max(max_capture_from_start, move_capture_count(vm))
         
         # Verifica se este movimento tem mais capturas disponíveis
         further_captures = get_piece_captures(board, dest_row, dest_col)
@@ -91,34 +162,50 @@ def update_game_state(game_state, move):
         game_state['valid_moves'] = []
         game_state['original_valid_moves'] = []  # Limpa os movimentos armazenados
         game_state['current_player'] = 'BLACK' if game_state['current_player'] == 'RED' else 'RED'
+        position_hash ^= ZOBRIST_BLACK_TO_MOVE
+        mirror_hash ^= ZOBRIST_BLACK_TO_MOVE
+        turn_ended = True
     else:
         # Só continua a sequência de captura se esta foi uma captura máxima até agora
         # e há mais capturas disponíveis
         game_state['selected_piece'] = (dest_row, dest_col)
         game_state['valid_moves'] = get_valid_moves(board, dest_row, dest_col, chain_capture=True)
+        turn_ended = False
+    
+    game_state['mirror_hash'] = mirror_hash
+    _record_position(game_state, position_hash, irreversible, turn_ended)
     
     # Verifica se um lado não tem mais peças.
     check_game_over(game_state)
     
     return game_state
 
+def _record_position(game_state, position_hash, irreversible, turn_ended):
+    """
+    Atualiza o histórico de posições em O(1): o hash da nova posição, sua contagem de
+    ocorrências e o contador de lances sem progresso.
+    """
+    game_state['hash'] = position_hash
+    if irreversible:
+        # Nenhuma posição anterior pode se repetir depois de uma jogada irreversível.
+        game_state['position_counts'] = {}
+        game_state['quiet_plies'] = 0
+    else:
+        game_state['quiet_plies'] = game_state.get('quiet_plies', 0) + 1
+    if turn_ended:
+        counts = game_state.setdefault('position_counts', {})
+        counts[position_hash] = counts.get(position_hash, 0) + 1
+        game_state['repetitions'] = counts[position_hash]
+    else:
+        # No meio de uma cadeia de captura a posição nunca é repetida.
+        game_state['repetitions'] = 0
+
 def has_any_valid_moves(game_state, player):
     """
     Verifica se um jogador tem algum movimento válido com qualquer uma de suas peças.
     Retorna True se pelo menos um movimento válido existir, False caso contrário.
     """
-    board = game_state['board']
-    board_size = len(board)
-    piece_char = 'r' if player == 'RED' else 'b'
-    
-    for row in range(board_size):
-        for col in range(board_size):
-            piece = board[row][col]
-            if piece.lower() == piece_char:
-                # Verifica se esta peça tem algum movimento válido
-                if get_valid_moves(board, row, col):
-                    return True
-    return False
+    return next(generate_moves(game_state['board'], player), None) is not None
 
 def check_game_over(game_state):
     board = game_state['board']
@@ -141,6 +228,14 @@ def check_game_over(game_state):
         return
     
 
+    # Empate por repetição tripla ou por excesso de lances sem captura nem movimento de peça simples.
+    if (game_state.get('repetitions', 0) >= settings.DRAW_REPETITIONS or
+            game_state.get('quiet_plies', 0) >= settings.DRAW_QUIET_PLIES):
+        game_state['game_over'] = True
+        game_state['winner'] = None
+        game_state['draw'] = True
+        return
+
     current_player = game_state['current_player']
     if not has_any_valid_moves(game_state, current_player):
         game_state['game_over'] = True
@@ -155,16 +250,29 @@ def select_piece(game_state, row, col):
        (game_state['current_player'] == 'BLACK' and piece.lower() == 'r'):
         return False
     
-    valid_moves = get_valid_moves(board, row, col)
+    valid_moves, must_capture = get_legal_piece_moves(board, game_state['current_player'], row, col)
     if not valid_moves:
         return False
     
     game_state['selected_piece'] = (row, col)
     game_state['valid_moves'] = valid_moves
     game_state['original_valid_moves'] = valid_moves.copy()  # Armazena uma cópia dos movimentos válidos originais
-    game_state['must_capture'] = has_captures_available(board, game_state['current_player'])
+    game_state['must_capture'] = must_capture
     return True
 
+def get_legal_piece_moves(board, player, row, col):
+    """
+    Retorna (valid_moves, must_capture) para a peça em (row, col), respeitando a captura obrigatória:
+    se o jogador tiver qualquer captura disponível, apenas capturas são permitidas.
+    """
+    valid_moves = []
+    must_capture = False
+    for move in generate_moves(board, player):
+        must_capture = move_capture_count(move) > 0
+        if move_from(move) == (row, col):
+            valid_moves.append(move)
+    return valid_moves, must_capture
+
 def get_game_status(game_state):
     status = {
         'current_player': game_state['current_player'],
@@ -191,11 +299,19 @@ def can_select_piece(game_state, row, col):
 def process_click(game_state, row, col):
     if game_state['selected_piece'] is not None:
         for move in game_state['valid_moves']:
-            if move[0] == row and move[1] == col:
+            if move_to(move) == (row, col):
                 return update_game_state(game_state, move)
         game_state['selected_piece'] = None
         game_state['valid_moves'] = []
         return game_state
     else:
         select_piece(game_state, row, col)
-        return game_state
\ No newline at end of file
+        return game_state
+
+def position_key(game_state):
+    """
+    Retorna uma chave imutável que identifica a posição atual:
+    o tabuleiro, o jogador da vez e a peça em meio a uma cadeia de captura (se houver).
+    """
+    board_key = tuple(''.join(row) for row in game_state['board'])
+    return (board_key, game_state['current_player'], game_state.get('selected_piece'))
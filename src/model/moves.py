@@ -1,12 +1,58 @@
 from copy import deepcopy  # Para simular alterações no tabuleiro durante capturas
 
+# Codificação das jogadas: cada jogada é um único int com a casa de origem (5 bits), a casa de
+# destino (5 bits) e a máscara das casas capturadas (32 bits). Só as 32 casas escuras são
+# jogáveis, então 42 bits bastam e a jogada cabe em um array('Q'). O número de peças
+# capturadas é a contagem de bits da máscara.
+SQUARE_POSITIONS = [(row, col) for row in range(8) for col in range(8) if (row + col) % 2 != 0]
+SQUARE_INDEX = [[None] * 8 for _ in range(8)]
+for _square, (_row, _col) in enumerate(SQUARE_POSITIONS):
+    SQUARE_INDEX[_row][_col] = _square
+
+_SQUARE_BITS = 0x1F
+_TO_SHIFT = 5
+_CAPTURE_SHIFT = 10
+
+def encode_move(from_pos, to_pos, captured_positions=()):
+    move = SQUARE_INDEX[from_pos[0]][from_pos[1]] | (SQUARE_INDEX[to_pos[0]][to_pos[1]] << _TO_SHIFT)
+    for row, col in captured_positions:
+        move |= 1 << (_CAPTURE_SHIFT + SQUARE_INDEX[row][col])
+    return move
+
+def move_from(move):
+    """Casa (row, col) de origem da jogada."""
+    return SQUARE_POSITIONS[move & _SQUARE_BITS]
+
+def move_to(move):
+    """Casa (row, col) de destino da jogada."""
+    return SQUARE_POSITIONS[(move >> _TO_SHIFT) & _SQUARE_BITS]
+
+def move_capture_count(move):
+    """Número de peças capturadas (0 para movimentos simples)."""
+    return (move >> _CAPTURE_SHIFT).bit_count()
+
+def move_captures(move):
+    """Lista das casas (row, col) das peças capturadas, em ordem de casa."""
+    captures = []
+    mask = move >> _CAPTURE_SHIFT
+    while mask:
+        low_bit = mask & -mask
+        captures.append(SQUARE_POSITIONS[low_bit.bit_length() - 1])
+        mask ^= low_bit
+    return captures
+
+def decode_move(move):
+    """
+    Converte a jogada para o formato legível (from_pos, (row, col, capture_count, captured_positions)),
+    útil para a interface e para depuração.
+    """
+    to_row, to_col = move_to(move)
+    return move_from(move), (to_row, to_col, move_capture_count(move), move_captures(move))
+
 def get_valid_moves(board, row, col, chain_capture=False):
     """
-    Retorna uma lista de movimentos válidos para a peça em (row, col).
-    Cada movimento é uma tupla (target_row, target_col, move_value, captured_positions) onde:
-      • move_value == 0 para um movimento normal (sem captura),
-      • um inteiro positivo indica o número total de oponentes capturados ao longo da cadeia.
-    captured_positions é uma lista de (row, col) para peças capturadas ao longo da rota.
+    Retorna uma lista de movimentos válidos (jogadas codificadas, ver encode_move) para a peça em (row, col).
+    Capturas incluem as sequências parciais; move_capture_count dá o total de oponentes capturados.
     Quando chain_capture é True apenas movimentos de captura são retornados.
     """
     moves = []
@@ -14,9 +60,6 @@ def get_valid_moves(board, row, col, chain_capture=False):
     if piece == '.':
         return moves
 
-    board_size = len(board)
-    is_king = piece.isupper()
-
     if chain_capture:
         captures = get_piece_captures(board, row, col)
         if captures:
@@ -24,24 +67,7 @@ def get_valid_moves(board, row, col, chain_capture=False):
                 moves.append(cap)
             # Não adiciona mais a opção "fim" - turnos terminarão automaticamente após capturas parciais
     else:
-        # Movimentos sem captura:
-        if is_king:
-            directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-            for dr, dc in directions:
-                r, c = row + dr, col + dc
-                while 0 <= r < board_size and 0 <= c < board_size and board[r][c] == '.':
-                    moves.append((r, c, 0, []))
-                    r += dr
-                    c += dc
-        else:
-            if piece.lower() == 'r':
-                directions = [(-1, -1), (-1, 1)]
-            else:
-                directions = [(1, -1), (1, 1)]
-            for dr, dc in directions:
-                r, c = row + dr, col + dc
-                if 0 <= r < board_size and 0 <= c < board_size and board[r][c] == '.':
-                    moves.append((r, c, 0, []))
+        moves.extend(get_quiet_moves(board, row, col))
         
         # Adiciona todos os movimentos de captura, incluindo capturas intermediárias
         captures = get_piece_captures(board, row, col)
@@ -51,16 +77,67 @@ def get_valid_moves(board, row, col, chain_capture=False):
             moves.append(move)
     return moves
 
+def get_quiet_moves(board, row, col):
+    """
+    Retorna os movimentos sem captura (jogadas codificadas) da peça em (row, col).
+    """
+    moves = []
+    piece = board[row][col]
+    board_size = len(board)
+    from_square = SQUARE_INDEX[row][col]
+    if piece.isupper():
+        directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+        for dr, dc in directions:
+            r, c = row + dr, col + dc
+            while 0 <= r < board_size and 0 <= c < board_size and board[r][c] == '.':
+                moves.append(from_square | (SQUARE_INDEX[r][c] << _TO_SHIFT))
+                r += dr
+                c += dc
+    else:
+        if piece.lower() == 'r':
+            directions = [(-1, -1), (-1, 1)]
+        else:
+            directions = [(1, -1), (1, 1)]
+        for dr, dc in directions:
+            r, c = row + dr, col + dc
+            if 0 <= r < board_size and 0 <= c < board_size and board[r][c] == '.':
+                moves.append(from_square | (SQUARE_INDEX[r][c] << _TO_SHIFT))
+    return moves
+
+def generate_moves(board, player):
+    """
+    Gera, sob demanda, as jogadas legais (codificadas) do jogador.
+    Percorre as peças do jogador uma única vez procurando capturas; se alguma existir,
+    apenas capturas são geradas (captura obrigatória). Caso contrário, gera os movimentos simples.
+    Por ser um gerador, quem consome pode parar antes de gerar todas as jogadas.
+    """
+    piece_char = 'r' if player == 'RED' else 'b'
+    board_size = len(board)
+    pieces = []
+    found_capture = False
+    for row in range(board_size):
+        for col in range(board_size):
+            if board[row][col].lower() == piece_char:
+                pieces.append((row, col))
+                for capture in get_piece_captures(board, row, col):
+                    found_capture = True
+                    yield capture
+    if found_capture:
+        return
+    for row, col in pieces:
+        yield from get_quiet_moves(board, row, col)
+
 def get_piece_captures(board, row, col):
     """
     Auxiliar recursivo para calcular movimentos de captura que podem incluir múltiplos saltos.
-    Retorna uma lista de movimentos como tuplas: (end_row, end_col, capture_count, captured_positions).
+    Retorna uma lista de jogadas codificadas; a máscara de capturas acumula as peças de toda a cadeia.
     Agora inclui posições de captura intermediárias como movimentos válidos.
     """
     piece = board[row][col]
     if piece == '.':
         return []
     board_size = len(board)
+    from_square = SQUARE_INDEX[row][col]
     moves = []
     opponent = 'b' if piece.lower() == 'r' else 'r'
 
@@ -92,12 +169,12 @@ def get_piece_captures(board, row, col):
                         new_board[r][c] = piece
                         
                         # Sempre adiciona a captura única atual como um movimento válido
-                        moves.append((r, c, 1, [(captured_r, captured_c)]))
+                        captured_bit = 1 << (_CAPTURE_SHIFT + SQUARE_INDEX[captured_r][captured_c])
+                        moves.append(from_square | (SQUARE_INDEX[r][c] << _TO_SHIFT) | captured_bit)
                         
-                        subsequent = get_piece_captures(new_board, r, c)
-                        if subsequent:
-                            for move in subsequent:
-                                moves.append((move[0], move[1], move[2] + 1, [(captured_r, captured_c)] + move[3]))
+                        # Saltos seguintes: troca a origem pela desta peça e soma a captura atual.
+                        for move in get_piece_captures(new_board, r, c):
+                            moves.append((move & ~_SQUARE_BITS) | from_square | captured_bit)
                         
                         r += dr
                         c += dc
@@ -118,23 +195,11 @@ def get_piece_captures(board, row, col):
                     new_board[end_r][end_c] = piece
                     
                     # Sempre adiciona a captura única atual como um movimento válido
-                    moves.append((end_r, end_c, 1, [(mid_r, mid_c)]))
+                    captured_bit = 1 << (_CAPTURE_SHIFT + SQUARE_INDEX[mid_r][mid_c])
+                    moves.append(from_square | (SQUARE_INDEX[end_r][end_c] << _TO_SHIFT) | captured_bit)
                     
-                    subsequent = get_piece_captures(new_board, end_r, end_c)
-                    if subsequent:
-                        for move in subsequent:
-                            moves.append((move[0], move[1], move[2] + 1, [(mid_r, mid_c)] + move[3]))
+                    # Saltos seguintes: troca a origem pela desta peça e soma a captura atual.
+                    for move in get_piece_captures(new_board, end_r, end_c):
+                        moves.append((move & ~_SQUARE_BITS) | from_square | captured_bit)
     
     return moves
-
-def has_captures_available(board, current_player):
-    board_size = len(board)
-    for r in range(board_size):
-        for c in range(board_size):
-            piece = board[r][c]
-            if (piece != '.' and 
-                ((current_player == 'RED' and piece.lower() == 'r') or 
-                 (current_player == 'BLACK' and piece.lower() == 'b'))):
-                if get_piece_captures(board, r, c):
-                    return True
-    return False
\ No newline at end of file
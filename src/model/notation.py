@@ -0,0 +1,115 @@
+"""
+Notação compacta de posições.
+
+Formato: "<linhas> <vez>[ <peça em captura>]"
+- linhas: as 8 linhas do tabuleiro de cima (linha 0) para baixo, separadas por '/'.
+  Cada peça é 'r', 'R', 'b' ou 'B' e um dígito indica uma sequência de casas vazias.
+- vez: 'r' (vermelhas) ou 'b' (pretas).
+- peça em captura (opcional): a casa da peça no meio de uma cadeia de captura.
+
+Casas são escritas como coluna 'a'-'h' e número 8-1 (linha 0 é o 8), por exemplo 'b8'.
+A posição inicial, com as vermelhas na vez, é:
+    1b1b1b1b/b1b1b1b1/1b1b1b1b/8/8/r1r1r1r1/1r1r1r1r/r1r1r1r1 r
+"""
+from .game_state import game_state_from_position
+from .moves import move_from, move_to, move_captures
+
+BOARD_SIZE = 8
+_PLAYERS = {'r': 'RED', 'b': 'BLACK'}
+_PLAYER_CODES = {'RED': 'r', 'BLACK': 'b'}
+_COLUMNS = 'abcdefgh'
+
+
+def square_name(pos):
+    row, col = pos
+    return f"{_COLUMNS[col]}{BOARD_SIZE - row}"
+
+
+def parse_square(name):
+    if len(name) != 2 or name[0] not in _COLUMNS or not name[1].isdigit():
+        raise ValueError(f"casa inválida: {name!r}")
+    row = BOARD_SIZE - int(name[1])
+    if not 0 <= row < BOARD_SIZE:
+        raise ValueError(f"casa inválida: {name!r}")
+    return (row, _COLUMNS.index(name[0]))
+
+
+def parse_board(text):
+    """
+    Converte a notação em (linhas, jogador, peça_em_captura) sem construir um game_state.
+    Levanta ValueError se o texto for inválido.
+    """
+    fields = text.split()
+    if len(fields) not in (2, 3):
+        raise ValueError(f"posição inválida: {text!r}")
+    ranks = fields[0].split('/')
+    if len(ranks) != BOARD_SIZE:
+        raise ValueError(f"a posição deve ter {BOARD_SIZE} linhas: {text!r}")
+    rows = []
+    for rank in ranks:
+        row = []
+        for char in rank:
+            if char in 'rRbB':
+                row.append(char)
+            elif char.isdigit():
+                row.extend('.' * int(char))
+            else:
+                raise ValueError(f"caractere inválido {char!r} em {text!r}")
+        if len(row) != BOARD_SIZE:
+            raise ValueError(f"linha com tamanho errado: {rank!r}")
+        rows.append(''.join(row))
+    player = _PLAYERS.get(fields[1])
+    if player is None:
+        raise ValueError(f"jogador da vez inválido: {fields[1]!r}")
+    selected = parse_square(fields[2]) if len(fields) == 3 else None
+    if selected is not None and rows[selected[0]][selected[1]].lower() != fields[1]:
+        raise ValueError(f"a casa {fields[2]} não tem uma peça do jogador da vez")
+    return rows, player, selected
+
+
+def parse_position(text):
+    """Cria um game_state a partir da notação compacta."""
+    rows, player, selected = parse_board(text)
+    return game_state_from_position(rows, player, selected)
+
+
+def format_board(board, current_player, selected_piece=None):
+    ranks = []
+    for row in board:
+        rank = []
+        empty = 0
+        for cell in row:
+            if cell == '.':
+                empty += 1
+                continue
+            if empty:
+                rank.append(str(empty))
+                empty = 0
+            rank.append(cell)
+        if empty:
+            rank.append(str(empty))
+        ranks.append(''.join(rank))
+    text = f"{'/'.join(ranks)} {_PLAYER_CODES[current_player]}"
+    if selected_piece is not None:
+        text += f" {square_name(selected_piece)}"
+    return text
+
+
+def format_position(game_state):
+    """Escreve o game_state na notação compacta."""
+    return format_board(game_state['board'], game_state['current_player'], game_state.get('selected_piece'))
+
+
+def format_move(move):
+    """
+    Escreve uma jogada codificada: 'c3-d4' para movimentos simples e
+    'c3xg7:d4,f6' para capturas, com as casas das peças capturadas após ':'.
+    """
+    if move is None:
+        return None
+    origin = square_name(move_from(move))
+    target = square_name(move_to(move))
+    captured = move_captures(move)
+    if not captured:
+        return f"{origin}-{target}"
+    return f"{origin}x{target}:{','.join(square_name(pos) for pos in captured)}"
@@ -0,0 +1,46 @@
+"""
+Simetria de cores do tabuleiro.
+
+Girar o tabuleiro 180° e trocar as cores (e o jogador da vez) produz uma posição equivalente,
+com a avaliação de sinal trocado — initialize_pieces monta exatamente esse espelho.
+canonical_key escolhe um representante único entre a posição e seu espelho, para que
+caches (tabela de transposição, resultados de análise) compartilhem a mesma entrada.
+"""
+from .moves import encode_move, move_from, move_to, move_captures
+
+_SWAPPED_COLOR = {'r': 'b', 'R': 'B', 'b': 'r', 'B': 'R', '.': '.'}
+
+
+def mirror_square(pos, board_size=8):
+    return (board_size - 1 - pos[0], board_size - 1 - pos[1])
+
+
+def mirror_board(board):
+    board_size = len(board)
+    return [[_SWAPPED_COLOR[board[board_size - 1 - r][board_size - 1 - c]] for c in range(board_size)]
+            for r in range(board_size)]
+
+
+def mirror_move(move):
+    """Espelha uma jogada codificada (ver moves.encode_move)."""
+    if move is None:
+        return None
+    return encode_move(mirror_square(move_from(move)), mirror_square(move_to(move)),
+                       [mirror_square(pos) for pos in move_captures(move)])
+
+
+def canonical_key(game_state):
+    """
+    Retorna (chave, sinal). A chave é a mesma para a posição e seu espelho; sinal é 1 se a
+    posição já é a canônica e -1 se é o espelho. Placares (do ponto de vista das pretas) e
+    jogadas guardados na orientação canônica devem ser multiplicados pelo sinal e espelhados
+    de volta quando sinal == -1.
+    """
+    position_hash = game_state['hash']
+    mirror_hash = game_state['mirror_hash']
+    selected = game_state.get('selected_piece')
+    if position_hash <= mirror_hash:
+        return (position_hash, selected), 1
+    if selected is not None:
+        selected = mirror_square(selected, len(game_state['board']))
+    return (mirror_hash, selected), -1
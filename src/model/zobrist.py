@@ -0,0 +1,59 @@
+"""
+Hash de Zobrist das posições.
+
+Cada combinação (peça, casa) tem um número aleatório de 64 bits; o hash de uma posição é o XOR
+dos números das peças presentes, mais um número extra quando as pretas têm a vez. Assim o hash
+pode ser atualizado em O(1) a cada jogada, fazendo XOR apenas das casas que mudaram.
+
+Também mantemos o hash do espelho da posição (tabuleiro girado 180° com as cores trocadas),
+usado por src/model/symmetry.py para que uma posição e seu espelho compartilhem entradas de cache.
+
+As chaves vêm de src/model/engine_tables.bin (ver src/model/engine_tables.py).
+"""
+from .engine_tables import load_zobrist_keys, PIECES
+
+_keys = load_zobrist_keys()
+
+ZOBRIST_PIECES = {
+    piece: [_keys[index * 64 + row * 8:index * 64 + row * 8 + 8].tolist() for row in range(8)]
+    for index, piece in enumerate(PIECES)
+}
+ZOBRIST_BLACK_TO_MOVE = _keys[-1]
+
+_SWAPPED_COLOR = {'r': 'b', 'R': 'B', 'b': 'r', 'B': 'R'}
+
+# Chave de cada (peça, casa) no espelho: a peça de cor trocada na casa girada 180°.
+ZOBRIST_MIRROR_PIECES = {
+    piece: [[ZOBRIST_PIECES[_SWAPPED_COLOR[piece]][7 - r][7 - c] for c in range(8)] for r in range(8)]
+    for piece in 'rRbB'
+}
+
+
+def hash_position(board, current_player):
+    """Calcula do zero o hash de Zobrist do tabuleiro e do jogador da vez."""
+    h = ZOBRIST_BLACK_TO_MOVE if current_player == 'BLACK' else 0
+    for row in range(len(board)):
+        for col in range(len(board)):
+            piece = board[row][col]
+            if piece != '.':
+                h ^= ZOBRIST_PIECES[piece][row][col]
+    return h
+
+
+def hash_mirror_position(board, current_player):
+    """Calcula do zero o hash do espelho da posição (cores trocadas, tabuleiro girado 180°)."""
+    h = ZOBRIST_BLACK_TO_MOVE if current_player == 'RED' else 0
+    for row in range(len(board)):
+        for col in range(len(board)):
+            piece = board[row][col]
+            if piece != '.':
+                h ^= ZOBRIST_MIRROR_PIECES[piece][row][col]
+    return h
+
+
+def piece_hash(piece, row, col):
+    return ZOBRIST_PIECES[piece][row][col]
+
+
+def mirror_piece_hash(piece, row, col):
+    return ZOBRIST_MIRROR_PIECES[piece][row][col]
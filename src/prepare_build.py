@@ -0,0 +1,36 @@
+"""
+Gera os arquivos pré-processados que vão no pacote web (pygbag).
+
+Uso (antes de empacotar):
+    python -m src.prepare_build
+
+- src/view/assets/menu_bg_scaled.jpg: fundo dos menus já no tamanho da janela, gerado a
+  partir de art/menu_bg.jpeg. A pasta art/ fica fora do pacote web (pygbag.ini), então o
+  navegador baixa só a versão pequena;
+- src/model/engine_tables.bin: chaves de Zobrist em binário (src/model/engine_tables.py).
+"""
+import os
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+from src.config.settings import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.model.engine_tables import write_tables, TABLES_PATH
+from src.view.menu_view import BACKGROUND_PATH, SCALED_BACKGROUND_PATH
+
+
+def scale_background(source=BACKGROUND_PATH, target=SCALED_BACKGROUND_PATH):
+    image = pygame.image.load(source)
+    pygame.image.save(pygame.transform.smoothscale(image, (WINDOW_WIDTH, WINDOW_HEIGHT)), target)
+
+
+def main():
+    scale_background()
+    print(f"{SCALED_BACKGROUND_PATH}: {os.path.getsize(SCALED_BACKGROUND_PATH)} bytes")
+    write_tables()
+    print(f"{TABLES_PATH}: {os.path.getsize(TABLES_PATH)} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 import pygame
 from src.config.settings import *
+from src.model.moves import move_to, move_capture_count
 
 def draw_board(screen):
     for row in range(BOARD_SIZE):
@@ -45,7 +46,8 @@ def highlight_selected(screen, row, col):
 
 def highlight_valid_moves(screen, valid_moves):
     for move in valid_moves:
-        row, col, capture_val, _ = move
+        row, col = move_to(move)
+        capture_val = move_capture_count(move)
         x = col * SQUARE_SIZE + SQUARE_SIZE // 2
         y = row * SQUARE_SIZE + SQUARE_SIZE // 2
         radius = SQUARE_SIZE // 4
@@ -56,7 +58,7 @@ def highlight_valid_moves(screen, valid_moves):
         pygame.draw.circle(surface, COLORS['VALID_MOVE'], (radius, radius), radius)
         screen.blit(surface, (x - radius, y - radius))
         # Se este for um movimento de captura, exibe o número de peças capturadas
-        if isinstance(capture_val, int) and capture_val > 0:
+        if capture_val > 0:
             font = pygame.font.SysFont('Arial', radius)
             text = font.render(str(capture_val), True, (255, 255, 255))
             text_rect = text.get_rect(center=(x, y))
@@ -69,7 +71,7 @@ def highlight_last_move(screen, last_move):
     highlight_selected(screen, start_pos[0], start_pos[1])
     highlight_selected(screen, end_pos[0], end_pos[1])
 
-def render_game_state(screen, game_state):
+def render_game_state(screen, game_state, flip=True):
     draw_board(screen)
     draw_pieces(screen, game_state['board'])
     
@@ -80,7 +82,8 @@ def render_game_state(screen, game_state):
     highlight_valid_moves(screen, game_state['valid_moves'])
     highlight_last_move(screen, game_state['last_move'])
     
-    pygame.display.flip()
+    if flip:
+        pygame.display.flip()
 
 def draw_game_over(screen, winner):
     surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
@@ -88,7 +91,8 @@ def draw_game_over(screen, winner):
     screen.blit(surface, (0, 0))
     
     font = pygame.font.SysFont('Arial', 48)
-    text = font.render(f'{winner} vencem!', True, COLORS['BOARD_LIGHT'])
+    message = f'{winner} vencem!' if winner else 'Empate!'
+    text = font.render(message, True, COLORS['BOARD_LIGHT'])
     text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
     screen.blit(text, text_rect)
     
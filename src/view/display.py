@@ -0,0 +1,13 @@
+import pygame
+from src.config.settings import WINDOW_WIDTH, WINDOW_HEIGHT
+
+
+def init_display():
+    """
+    Inicia só os subsistemas do pygame que o jogo usa (vídeo, que inclui eventos e mouse,
+    e fontes) e devolve a janela. pygame.init() também iniciaria áudio e joystick, o que
+    atrasa a abertura do menu, principalmente no navegador.
+    """
+    pygame.display.init()
+    pygame.font.init()
+    return pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
@@ -2,17 +2,35 @@ import os
 import pygame
 from src.config.settings import *
 
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+# Original em alta resolução, fora do pacote web (ver pygbag.ini).
+BACKGROUND_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                               'art', 'menu_bg.jpeg')
+# Fundo já no tamanho da janela, gerado no build por python -m src.prepare_build.
+SCALED_BACKGROUND_PATH = os.path.join(ASSETS_DIR, 'menu_bg_scaled.jpg')
+
+_background_cache = {}
+
 def load_background():
+    """Carrega o fundo dos menus na primeira chamada; as seguintes reutilizam a mesma superfície."""
+    if 'surface' not in _background_cache:
+        _background_cache['surface'] = _load_background_image()
+    return _background_cache['surface']
+
+def _load_background_image():
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        image_path = os.path.join(current_dir, 'assets', 'menu_bg.jpeg')
-        bg_image = pygame.image.load(image_path)
-        return pygame.transform.scale(bg_image, (WINDOW_WIDTH, WINDOW_HEIGHT))
+        if os.path.exists(SCALED_BACKGROUND_PATH):
+            bg_image = pygame.image.load(SCALED_BACKGROUND_PATH)
+            if bg_image.get_size() == (WINDOW_WIDTH, WINDOW_HEIGHT):
+                return bg_image.convert()
+        # Sem o arquivo pré-escalado (ou com outro tamanho de janela): escala o original.
+        bg_image = pygame.image.load(BACKGROUND_PATH)
+        return pygame.transform.scale(bg_image, (WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
     except Exception as e:
         print(f"Erro ao carregar o fundo: {e}")
         return None
 
-def render_menu(screen):
+def render_menu(screen, flip=True):
     bg_image = load_background()
     if bg_image:
         screen.blit(bg_image, (0, 0))
@@ -43,7 +61,8 @@ def render_menu(screen):
         
         draw_button(screen, button, (x, y), is_hovered)
     
-    pygame.display.flip()
+    if flip:
+        pygame.display.flip()
     return button_positions
 
 def create_button(text, font_size=36, width=300, height=50):
@@ -79,7 +98,7 @@ def draw_button(screen, button, position, is_hovered=False):
     text_y = y + (button['rect'].height - button['text'].get_height()) // 2
     screen.blit(button['text'], (text_x, text_y))
 
-def render_settings_menu(screen):
+def render_settings_menu(screen, flip=True):
     """Renderiza o menu de configurações com opções de dificuldade."""
     from src.config.settings_manager import get_ai_difficulty
     
@@ -154,7 +173,8 @@ def render_settings_menu(screen):
     text_y = start_y + (len(buttons) * button_spacing) + 20
     screen.blit(text_surface, (text_x, text_y))
     
-    pygame.display.flip()
+    if flip:
+        pygame.display.flip()
     return button_positions
 
 def render_pause_menu(screen):
@@ -0,0 +1,24 @@
+import pygame
+from src.config.settings import *
+
+
+def draw_profiler_overlay(screen, summary):
+    """Desenha no canto da tela os percentis de tempo de quadro e de cada fase (em ms)."""
+    if not summary:
+        return
+    font = pygame.font.SysFont('Arial', 14)
+    frame = summary['frame']
+    lines = [
+        f"quadro p50 {frame['p50']:.1f}  p95 {frame['p95']:.1f}  p99 {frame['p99']:.1f}  máx {frame['max']:.1f}",
+        f"quadros {summary['frames']}  lentos {summary['slow_frames']}",
+    ]
+    for phase, stats in summary['phases'].items():
+        lines.append(f"{phase:8} p50 {stats['p50']:.1f}  p99 {stats['p99']:.1f}  máx {stats['max']:.1f}")
+
+    line_height = 18
+    surface = pygame.Surface((330, line_height * len(lines) + 10), pygame.SRCALPHA)
+    surface.fill((0, 0, 0, 170))
+    for i, line in enumerate(lines):
+        text = font.render(line, True, COLORS['BOARD_LIGHT'])
+        surface.blit(text, (6, 5 + i * line_height))
+    screen.blit(surface, (5, 5))